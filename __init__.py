@@ -69,8 +69,7 @@ def on_download_finished(song: UsdbSong) -> None:
         # Analyze and potentially transcode standalone audio (if present)
         audio_path = (
             song.sync_meta.path.parent / song.sync_meta.audio.file.fname
-            if getattr(song.sync_meta, "audio", None)
-            and song.sync_meta.audio
+            if song.sync_meta.audio
             and song.sync_meta.audio.file
             and song.sync_meta.audio.file.fname
             else None
@@ -1,7 +1,7 @@
 """Audio analysis using ffprobe.
 
 This module mirrors the existing video analyzer patterns in
-[`video_analyzer.analyze_video()`](video_analyzer.py:60), but focuses on audio streams.
+[`video_analyzer.analyze_video()`](video_analyzer.py:70), but focuses on audio streams.
 
 It supports:
 - audio-only files (e.g. .mp3/.m4a/.flac/.wav)
@@ -19,11 +19,13 @@ from typing import Optional
 
 from usdb_syncer.utils import LinuxEnvCleaner
 
+from .utils import FAST_PROBE_ARGS
+
 
 _logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioInfo:
     """Information about a media file's primary audio stream."""
 
@@ -38,11 +40,58 @@ class AudioInfo:
     has_video: bool
 
 
+# Raw streams have no header duration; a small probe only estimates it (and
+# the bitrate) from the first frames, so these always get the full probe.
+_RAW_AUDIO_FORMATS = frozenset({"mp3", "aac", "ac3", "eac3", "dts"})
+_RAW_AUDIO_SUFFIXES = frozenset({".mp3", ".aac", ".ac3", ".eac3", ".dts"})
+
+
 def analyze_audio(path: Path) -> Optional[AudioInfo]:
     """Analyze a media file with ffprobe and return AudioInfo.
 
+    Except for raw audio streams, a probe limited to the first 32 KiB is tried
+    first; if it does not yield every field AudioInfo needs, the file is probed
+    again with ffprobe's default limits.
+
     Returns None if analysis fails or if the file has no audio stream.
     """
+    data = None
+    if path.suffix.lower() not in _RAW_AUDIO_SUFFIXES:
+        data = _run_ffprobe(path, fast=True)
+    if data is None or not _is_fast_probe_complete(data):
+        _logger.debug(f"Fast probe skipped or incomplete for {path.name}; running full probe")
+        data = _run_ffprobe(path, fast=False)
+        if data is None:
+            return None
+    return _parse_ffprobe_output(data, path)
+
+
+def _is_fast_probe_complete(data: dict) -> bool:
+    """Return True if a fast probe has every field AudioInfo relies on."""
+    format_info = data.get("format", {})
+    if any(name in _RAW_AUDIO_FORMATS for name in format_info.get("format_name", "").split(",")):
+        return False
+    audio_stream = next((s for s in data.get("streams", []) if s.get("codec_type") == "audio"), None)
+    if not audio_stream:
+        return False
+    try:
+        return (
+            bool(audio_stream.get("codec_name"))
+            and int(audio_stream.get("sample_rate", 0)) > 0
+            and int(audio_stream.get("channels", 0)) > 0
+            and ("bit_rate" in audio_stream or "bit_rate" in format_info)
+            and float(format_info.get("duration", 0)) > 0
+        )
+    except (ValueError, TypeError):
+        return False
+
+
+def _run_ffprobe(path: Path, fast: bool) -> Optional[dict]:
+    """Run ffprobe on path and return its decoded JSON output, or None on failure.
+
+    Failures of the fast pass are logged at debug level only,
+    since the caller falls back to a full probe.
+    """
     cmd = [
         "ffprobe",
         "-v",
@@ -51,8 +100,11 @@ def analyze_audio(path: Path) -> Optional[AudioInfo]:
         "json",
         "-show_format",
         "-show_streams",
-        str(path),
     ]
+    if fast:
+        cmd.extend(FAST_PROBE_ARGS)
+    cmd.append(str(path))
+    log_failure = _logger.debug if fast else _logger.warning
 
     try:
         _logger.debug(f"Running ffprobe: {' '.join(cmd)}")
@@ -68,17 +120,16 @@ def analyze_audio(path: Path) -> Optional[AudioInfo]:
             )
 
         if result.returncode != 0:
-            _logger.warning(f"ffprobe failed for {path}: {result.stderr}")
+            log_failure(f"ffprobe failed for {path}: {result.stderr}")
             return None
 
-        data = json.loads(result.stdout)
-        return _parse_ffprobe_output(data, path)
+        return json.loads(result.stdout)
 
     except subprocess.TimeoutExpired:
         _logger.error(f"ffprobe timeout for {path}")
         return None
     except json.JSONDecodeError as e:
-        _logger.error(f"ffprobe output parse error: {e}")
+        log_failure(f"ffprobe output parse error: {e}")
         return None
     except Exception as e:
         _logger.error(f"ffprobe error for {path}: {type(e).__name__}: {e}")
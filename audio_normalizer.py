@@ -27,7 +27,7 @@ if TYPE_CHECKING:
 _logger = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LoudnormTargets:
     """User-facing targets for loudnorm."""
 
@@ -36,7 +36,7 @@ class LoudnormTargets:
     lra_lu: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LoudnormMeasurements:
     """Measurements returned by loudnorm pass 1."""
 
@@ -89,8 +89,7 @@ def discover_backups(
         # Audio
         audio_path = (
             sync_meta.path.parent / sync_meta.audio.file.fname
-            if getattr(sync_meta, "audio", None)
-            and sync_meta.audio
+            if sync_meta.audio
             and sync_meta.audio.file
             and sync_meta.audio.file.fname
             else None
@@ -392,7 +391,7 @@ def restore_backup(
                         "Could not update metadata after restore: video metadata missing. Song may show as out-of-sync."
                     )
             else:
-                if getattr(sync_meta, "audio", None) and sync_meta.audio and sync_meta.audio.file:
+                if sync_meta.audio and sync_meta.audio.file:
                     sync_meta.audio.file.mtime = get_mtime(original_media_path)
                     sync_meta.audio.file.fname = original_media_path.name
 
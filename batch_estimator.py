@@ -212,24 +212,39 @@ class BatchEstimator:
 
         Returns: required space in MB
         """
-        total_required = 0.0
-        
+        output_mb = 0.0
+        current_mb = 0.0
         for candidate in candidates:
-            if not candidate.selected:
-                continue
-                
-            # 1. Space for the new output file
-            total_required += candidate.estimated_output_size_mb
-            
-            # 2. Space for temporary file during transcoding (FFmpeg usually writes to a temp file)
-            # We assume it needs at least the same amount of space as the output
-            total_required += candidate.estimated_output_size_mb
-            
-            # 3. Space for rollback backup
-            # If rollback is enabled, we might need to keep the original file
-            # If backup_original is already True, it's already accounted for in the user's workflow,
-            # but for the *batch* operation, we still need to ensure we have space for it.
-            if rollback_enabled or backup_original:
-                total_required += candidate.current_size_mb
-                
+            if candidate.selected:
+                output_mb += candidate.estimated_output_size_mb
+                current_mb += candidate.current_size_mb
+
+        return BatchEstimator.disk_space_for_totals(output_mb, current_mb, rollback_enabled, backup_original)
+
+    @staticmethod
+    def disk_space_for_totals(
+        output_mb: float,
+        current_mb: float,
+        rollback_enabled: bool,
+        backup_original: bool
+    ) -> float:
+        """
+        Calculate disk space required from summed sizes of the selected candidates.
+
+        output_mb: total estimated output size; current_mb: total size of the originals.
+
+        Returns: required space in MB
+        """
+        # 1. Space for the new output files
+        # 2. Space for temporary files during transcoding (FFmpeg usually writes to a temp file)
+        # We assume they need at least the same amount of space as the outputs
+        total_required = 2 * output_mb
+
+        # 3. Space for rollback backups
+        # If rollback is enabled, we might need to keep the original files
+        # If backup_original is already True, it's already accounted for in the user's workflow,
+        # but for the *batch* operation, we still need to ensure we have space for it.
+        if rollback_enabled or backup_original:
+            total_required += current_mb
+
         return total_required
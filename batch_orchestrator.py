@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import logging
+import os
 import shutil
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal, Optional
@@ -34,8 +36,11 @@ if TYPE_CHECKING:
 
 _logger = logging.getLogger(__name__)
 
+# Number of concurrent ffprobe calls during a library scan.
+_SCAN_WORKERS = min(8, max(2, os.cpu_count() or 2))
 
-@dataclass
+
+@dataclass(slots=True)
 class BatchTranscodeCandidate:
     """Single media candidate for batch transcoding."""
     song_id: SongId
@@ -72,8 +77,13 @@ class BatchTranscodeCandidate:
     # Result (populated after transcode)
     result: Optional[TranscodeResult] = None
 
+    @property
+    def display_sort_key(self) -> tuple[str, str, bool]:
+        """Key for listing candidates: artist, then title, a song's video before its audio."""
+        return (self.artist.casefold(), self.song_title.casefold(), self.media_type != "video")
+
 
-@dataclass
+@dataclass(slots=True)
 class BatchTranscodeSummary:
     """Summary configuration for entire batch."""
     target_codec: str
@@ -110,7 +120,11 @@ class BatchTranscodeSummary:
 
 
 class ScanWorker(QtCore.QThread):
-    """Worker thread for scanning the library."""
+    """Worker thread for scanning the library.
+
+    Media probing is fanned out to a small thread pool; signals are emitted
+    only from this thread.
+    """
 
     # Signals
     progress = QtCore.Signal(int, int, str)  # current, total, filename
@@ -139,12 +153,29 @@ class ScanWorker(QtCore.QThread):
         
         # We need to count total songs first for progress
         metas = list(SyncMeta.get_in_folder(song_dir))
+        # Visit songs grouped by folder so stat/probe calls for neighbouring files
+        # hit warm directory and inode caches instead of seeking across the library.
+        metas.sort(key=lambda m: str(m.path.parent))
         total = len(metas)
-        
-        for i, sync_meta in enumerate(metas):
-            if self._abort_requested:
-                self.aborted.emit()
-                return
+
+        # Audio decision inputs are invariant for the whole scan; resolve them once
+        # instead of per file (handler lookup, lowercase target codec, flags).
+        audio_enabled = bool(self.cfg.audio.audio_transcode_enabled)
+        audio_handler = get_audio_codec_handler(self.cfg.audio.audio_codec)
+        target_audio_codec = self.cfg.audio.audio_codec.lower()
+        normalization_requested = bool(self.cfg.audio.audio_normalization_enabled)
+        force_audio = bool(getattr(self.cfg.audio, "force_transcode_audio", False))
+
+        def scan_song(
+            sync_meta: SyncMeta,
+        ) -> tuple[list[tuple[SongId, Path, object, Literal["video", "audio"]]], Optional[str]]:
+            """Probe one song's media files; returns its results and the last scanned filename.
+
+            Runs on a pool thread: only touches the already-loaded SyncMeta, the
+            filesystem and ffprobe (no database access, no signals).
+            """
+            song_results: list[tuple[SongId, Path, object, Literal["video", "audio"]]] = []
+            last_name: Optional[str] = None
 
             # Discover BOTH video and audio media paths for this song.
             video_path = (
@@ -154,8 +185,7 @@ class ScanWorker(QtCore.QThread):
             )
             audio_path = (
                 sync_meta.path.parent / sync_meta.audio.file.fname
-                if getattr(sync_meta, "audio", None)
-                and sync_meta.audio
+                if sync_meta.audio
                 and sync_meta.audio.file
                 and sync_meta.audio.file.fname
                 else None
@@ -164,8 +194,7 @@ class ScanWorker(QtCore.QThread):
             # Prefer scanning video first so progress feels familiar.
             for media_type, media_path in (("video", video_path), ("audio", audio_path)):
                 if self._abort_requested:
-                    self.aborted.emit()
-                    return
+                    break
 
                 if not media_path or not media_path.exists():
                     continue
@@ -174,7 +203,7 @@ class ScanWorker(QtCore.QThread):
                 if media_type == "audio" and not is_audio_file(media_path):
                     continue
 
-                self.progress.emit(i, total, media_path.name)
+                last_name = media_path.name
 
                 if media_type == "video":
                     info = analyze_video(media_path)
@@ -183,32 +212,48 @@ class ScanWorker(QtCore.QThread):
 
                     if self.cfg.general.force_transcode_video:
                         _logger.debug(f"Including {media_path.name} (force transcode enabled)")
-                        results.append((sync_meta.song_id, media_path, info, "video"))
+                        song_results.append((sync_meta.song_id, media_path, info, "video"))
                     elif needs_transcoding(info, self.cfg):
-                        results.append((sync_meta.song_id, media_path, info, "video"))
+                        song_results.append((sync_meta.song_id, media_path, info, "video"))
                 else:
                     # Audio scanning respects audio enable flag.
-                    if not bool(self.cfg.audio.audio_transcode_enabled):
+                    if not audio_enabled or not audio_handler:
                         continue
 
                     info = analyze_audio(media_path)
                     if not info:
                         continue
 
-                    handler = get_audio_codec_handler(self.cfg.audio.audio_codec)
-                    if not handler:
-                        continue
-
-                    container_matches = handler.is_container_compatible(media_path)
-                    codec_matches = (info.codec_name.lower() == self.cfg.audio.audio_codec.lower())
-                    normalization_requested = bool(self.cfg.audio.audio_normalization_enabled)
-                    force_audio = bool(getattr(self.cfg.audio, "force_transcode_audio", False))
+                    container_matches = audio_handler.is_container_compatible(media_path)
+                    codec_matches = (info.codec_name.lower() == target_audio_codec)
                     needs_audio = force_audio or normalization_requested or (not container_matches) or (not codec_matches)
 
                     if needs_audio:
                         if force_audio and container_matches and codec_matches and not normalization_requested:
                             _logger.debug(f"Including {media_path.name} (force audio transcode enabled)")
-                        results.append((sync_meta.song_id, media_path, info, "audio"))
+                        song_results.append((sync_meta.song_id, media_path, info, "audio"))
+
+            return song_results, last_name
+
+        # ffprobe runs in a subprocess, so several probes can be in flight at once.
+        # Results are consumed in submission order, which keeps the candidate order
+        # (and progress reporting) identical to a sequential scan.
+        with ThreadPoolExecutor(max_workers=_SCAN_WORKERS, thread_name_prefix="transcoder-scan") as executor:
+            futures = [executor.submit(scan_song, sync_meta) for sync_meta in metas]
+            for i, future in enumerate(futures):
+                if self._abort_requested:
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    self.aborted.emit()
+                    return
+
+                song_results, last_name = future.result()
+                if last_name is not None:
+                    self.progress.emit(i, total, last_name)
+                results.extend(song_results)
+
+        if self._abort_requested:
+            self.aborted.emit()
+            return
 
         self.finished.emit(results)
 
@@ -261,14 +306,23 @@ class BatchTranscodeOrchestrator:
         progress.setWindowIcon(icons.Icon.FFMPEG.icon())
         progress.setWindowModality(QtCore.Qt.WindowModality.WindowModal)
         progress.setMinimumDuration(0)
-        
+
+        # The label text changes for every scanned file. Force plain text so Qt skips
+        # rich-text detection/parsing on each update (and filenames containing '<'
+        # are shown verbatim).
+        progress_label = QtWidgets.QLabel(progress.labelText())
+        progress_label.setTextFormat(QtCore.Qt.TextFormat.PlainText)
+        progress.setLabel(progress_label)
+
         scan_results = []
         scan_aborted = False
 
         worker = ScanWorker(self.cfg)
         
         def on_progress(current, total, filename):
-            progress.setMaximum(total)
+            # The total is fixed for the whole scan; only touch the range when it changes.
+            if progress.maximum() != total:
+                progress.setMaximum(total)
             progress.setValue(current)
             progress.setLabelText(f"Scanning {current+1} of {total}: {filename}")
 
@@ -312,14 +366,23 @@ class BatchTranscodeOrchestrator:
         # 2. Create candidates from scan results
         self.candidates = []
         hw_accel_available = self._is_hw_accel_available()
-        
+
+        from usdb_syncer.usdb_song import UsdbSong
+        # A song with both video and audio yields two scan results; query it once.
+        songs: dict[SongId, Optional[UsdbSong]] = {}
+
         for song_id, media_path, info, media_type in scan_results:
             # Get song info for display
-            from usdb_syncer.usdb_song import UsdbSong
-            song = UsdbSong.get(song_id)
+            if song_id in songs:
+                song = songs[song_id]
+            else:
+                song = songs[song_id] = UsdbSong.get(song_id)
             title = song.title if song else media_path.stem
             artist = song.artist if song else "Unknown"
 
+            # One stat per file; reused for the current size and the audio estimate.
+            current_size_mb = media_path.stat().st_size / (1024 * 1024)
+
             # Estimates
             if media_type == "video":
                 est_size = BatchEstimator.estimate_output_size(info, self.cfg)  # type: ignore[arg-type]
@@ -336,7 +399,7 @@ class BatchTranscodeOrchestrator:
                 current_profile = None
                 current_pixel_format = None
                 current_bitrate_kbps = getattr(info, "bitrate_kbps", None)
-                est_size = (media_path.stat().st_size / (1024 * 1024))
+                est_size = current_size_mb
                 est_time = max(1.0, float(getattr(info, "duration_seconds", 0.0)) * 0.1)
 
             candidate = BatchTranscodeCandidate(
@@ -349,7 +412,7 @@ class BatchTranscodeOrchestrator:
                 current_resolution=current_resolution,
                 current_fps=current_fps,
                 current_container=getattr(info, "container", media_path.suffix.lstrip(".").lower()),
-                current_size_mb=media_path.stat().st_size / (1024 * 1024),
+                current_size_mb=current_size_mb,
                 duration_seconds=float(getattr(info, "duration_seconds", 0.0)),
                 current_profile=current_profile,
                 current_pixel_format=current_pixel_format,
@@ -374,6 +437,14 @@ class BatchTranscodeOrchestrator:
         audio_handler = get_audio_codec_handler(self.cfg.audio.audio_codec)
         audio_container = audio_handler.capabilities().container if audio_handler else "m4a"
         
+        # Count in one pass without materialising filtered lists.
+        total_videos = 0
+        selected_videos = 0
+        for c in self.candidates:
+            if c.media_type == "video":
+                total_videos += 1
+                selected_videos += c.selected
+
         self.summary = BatchTranscodeSummary(
             target_codec=self.cfg.target_codec,
             target_container=codec_cfg.container,
@@ -389,8 +460,8 @@ class BatchTranscodeOrchestrator:
             target_profile=getattr(codec_cfg, "profile", None),
             target_pixel_format=getattr(codec_cfg, "pixel_format", None),
             target_bitrate_kbps=self.cfg.general.max_bitrate_kbps,
-            total_videos=len([c for c in self.candidates if c.media_type == "video"]),
-            selected_videos=len([c for c in self.candidates if c.media_type == "video" and c.selected]),
+            total_videos=total_videos,
+            selected_videos=selected_videos,
             total_estimated_time_seconds=sum(c.estimated_time_seconds for c in self.candidates),
             total_disk_space_required_mb=BatchEstimator.calculate_disk_space_required(self.candidates, False, self.cfg.general.backup_original),
             current_free_space_mb=BatchEstimator.get_free_disk_space(self.candidates[0].video_path),
@@ -571,8 +642,9 @@ class BatchTranscodeOrchestrator:
         
         _logger.info("Applying backup preservation rule...")
         
+        candidates_by_song = self._candidates_by_song_id()
         for entry in self.rollback_manager.entries:
-            candidate = next((c for c in self.candidates if c.song_id == entry.song_id), None)
+            candidate = candidates_by_song.get(entry.song_id)
             if not candidate or not candidate.result or not candidate.result.success:
                 continue
             
@@ -586,6 +658,10 @@ class BatchTranscodeOrchestrator:
                 try:
                     # The rollback backup contains the pre-transcode version
                     if entry.rollback_backup_path.exists():
+                        if os.path.samefile(entry.rollback_backup_path, user_backup_path):
+                            # Hard-linked rollback backup: the user backup already holds
+                            # the pre-transcode content.
+                            continue
                         # Replace user backup with pre-transcode version
                         shutil.copy2(str(entry.rollback_backup_path), str(user_backup_path))
                         _logger.info(f"Updated user backup for {candidate.song_title}")
@@ -620,6 +696,13 @@ class BatchTranscodeOrchestrator:
                 user_backup_existed
             )
 
+    def _candidates_by_song_id(self) -> dict[SongId, BatchTranscodeCandidate]:
+        """Index candidates by song ID, keeping the first candidate for each song."""
+        by_song: dict[SongId, BatchTranscodeCandidate] = {}
+        for c in self.candidates:
+            by_song.setdefault(c.song_id, c)
+        return by_song
+
     def _get_completed_count(self) -> int:
         """Count how many selected media files have finished."""
         return sum(1 for c in self.candidates if c.selected and c.status in ("success", "failed", "aborted"))
@@ -645,8 +728,9 @@ class BatchTranscodeOrchestrator:
             success, failed, rolled_back_ids = self.rollback_manager.rollback_all()
             
             # Update candidate statuses for successfully rolled back videos
+            candidates_by_song = self._candidates_by_song_id()
             for song_id in rolled_back_ids:
-                candidate = next((c for c in self.candidates if c.song_id == song_id), None)
+                candidate = candidates_by_song.get(song_id)
                 if candidate and candidate.status == "success":
                     candidate.status = "rolled_back"
 
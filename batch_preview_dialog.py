@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Callable, Iterable, Optional
 
 from PySide6 import QtCore, QtGui, QtWidgets
 from PySide6.QtWidgets import (
@@ -12,8 +12,7 @@ from PySide6.QtWidgets import (
     QLabel,
     QLineEdit,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
     QCheckBox,
@@ -28,6 +27,180 @@ if TYPE_CHECKING:
 
 _logger = logging.getLogger(__name__)
 
+# Qt enum values used on the model's hot paths (data/flags/setData are called per
+# visible cell), bound once instead of resolved through QtCore.Qt on every call.
+_DISPLAY_ROLE = QtCore.Qt.ItemDataRole.DisplayRole
+_CHECK_STATE_ROLE = QtCore.Qt.ItemDataRole.CheckStateRole
+_CHECKED = QtCore.Qt.CheckState.Checked
+_UNCHECKED = QtCore.Qt.CheckState.Unchecked
+_CHECKABLE = QtCore.Qt.ItemFlag.ItemIsUserCheckable
+
+# Rows measured when sizing preview columns to their contents.
+_RESIZE_SAMPLE_ROWS = 50
+
+
+class BatchCandidateTableModel(QtCore.QAbstractTableModel):
+    """Table model over batch candidates.
+
+    Column 0 is the selection checkbox backed by ``candidate.selected``; the
+    remaining columns are display-only text produced by ``row_formatter``.
+    Rows are formatted the first time Qt (or the filter) asks for them, so
+    rows that are never shown are never formatted.
+    """
+
+    # Emitted when the user toggles a checkbox (not for programmatic updates).
+    selection_changed = QtCore.Signal()
+
+    def __init__(
+        self,
+        candidates: list[BatchTranscodeCandidate],
+        headers: list[str],
+        row_formatter: Callable[[BatchTranscodeCandidate], list[str]],
+        parent: Optional[QtCore.QObject] = None,
+    ):
+        super().__init__(parent)
+        self._candidates = candidates
+        self._headers = headers
+        self._row_formatter = row_formatter
+        self._rows: list[Optional[list[str]]] = [None] * len(candidates)
+        # Lowercased text of all display columns per row, built on first filter use.
+        self._search_texts: list[Optional[str]] = [None] * len(candidates)
+        # Display order keys, computed once so the proxy's sort doesn't rebuild them per comparison.
+        self._sort_keys = [c.display_sort_key for c in candidates]
+
+        # Running totals over selected candidates, kept in step by set_selected()
+        # so statistics never need to walk the full candidate list.
+        self.selected_count = 0
+        self.selected_time_seconds = 0.0
+        self.selected_output_mb = 0.0
+        self.selected_current_mb = 0.0
+        for c in candidates:
+            if c.selected:
+                self._add_to_totals(c, 1)
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._candidates)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(
+        self,
+        section: int,
+        orientation: QtCore.Qt.Orientation,
+        role: int = _DISPLAY_ROLE,
+    ) -> object:
+        if orientation == QtCore.Qt.Orientation.Horizontal and role == _DISPLAY_ROLE:
+            return self._headers[section]
+        return None
+
+    def data(self, index: QtCore.QModelIndex, role: int = _DISPLAY_ROLE) -> object:
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if col == 0:
+            if role == _CHECK_STATE_ROLE:
+                return _CHECKED if self._candidates[row].selected else _UNCHECKED
+            return None
+        if role == _DISPLAY_ROLE:
+            return self._row_texts(row)[col]
+        return None
+
+    def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlag:
+        flags = super().flags(index)
+        if index.column() == 0:
+            flags |= _CHECKABLE
+        return flags
+
+    def setData(self, index: QtCore.QModelIndex, value: object, role: int = QtCore.Qt.ItemDataRole.EditRole) -> bool:
+        if role != _CHECK_STATE_ROLE or index.column() != 0:
+            return False
+        selected = QtCore.Qt.CheckState(value) == _CHECKED
+        if self._candidates[index.row()].selected != selected:
+            self.set_selected(index.row(), selected)
+            self.selection_changed.emit()
+        return True
+
+    def search_text(self, row: int) -> str:
+        """Return the cached lowercase search text for a row."""
+        text = self._search_texts[row]
+        if text is None:
+            # Newline-separated so a search term cannot match across two columns.
+            text = self._search_texts[row] = "\n".join(self._row_texts(row)[1:]).lower()
+        return text
+
+    def sort_key(self, row: int) -> tuple[str, str, bool]:
+        """Return the display order key of a row."""
+        return self._sort_keys[row]
+
+    def _row_texts(self, row: int) -> list[str]:
+        """Return the display texts for a row, formatting it on first access."""
+        texts = self._rows[row]
+        if texts is None:
+            texts = self._rows[row] = self._row_formatter(self._candidates[row])
+        return texts
+
+    def set_selected(self, row: int, selected: bool) -> None:
+        """Set the selection state of one candidate without emitting selection_changed."""
+        self.set_selected_rows((row,), selected)
+
+    def set_selected_rows(self, rows: Iterable[int], selected: bool) -> None:
+        """Set the selection state of many candidates with a single dataChanged signal."""
+        first = last = -1
+        sign = 1 if selected else -1
+        for row in rows:
+            candidate = self._candidates[row]
+            if candidate.selected == selected:
+                continue
+            candidate.selected = selected
+            self._add_to_totals(candidate, sign)
+            if first < 0 or row < first:
+                first = row
+            if row > last:
+                last = row
+        if first >= 0:
+            self.dataChanged.emit(
+                self.index(first, 0), self.index(last, 0), [_CHECK_STATE_ROLE]
+            )
+
+    def _add_to_totals(self, c: BatchTranscodeCandidate, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) a candidate from the selection totals."""
+        self.selected_count += sign
+        self.selected_time_seconds += sign * c.estimated_time_seconds
+        self.selected_output_mb += sign * c.estimated_output_size_mb
+        self.selected_current_mb += sign * c.current_size_mb
+        if self.selected_count == 0:
+            # Drop accumulated float error once nothing is selected.
+            self.selected_time_seconds = self.selected_output_mb = self.selected_current_mb = 0.0
+
+
+class BatchCandidateFilterProxyModel(QtCore.QSortFilterProxyModel):
+    """Proxy that keeps rows whose cached search text contains the filter string.
+
+    Rows are shown by artist and title; the source model (and the batch) keep
+    scan order.
+    """
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self._needle = ""
+
+    def set_search_text(self, text: str) -> None:
+        """Set the (case-insensitive) filter string and re-filter."""
+        self._needle = text.lower()
+        self.invalidateFilter()
+
+    def accepts(self, source_row: int) -> bool:
+        """Return True if the given source row passes the current filter."""
+        return not self._needle or self._needle in self.sourceModel().search_text(source_row)
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QtCore.QModelIndex) -> bool:
+        return self.accepts(source_row)
+
+    def lessThan(self, source_left: QtCore.QModelIndex, source_right: QtCore.QModelIndex) -> bool:
+        model = self.sourceModel()
+        return model.sort_key(source_left.row()) < model.sort_key(source_right.row())
+
 
 class BatchPreviewDialog(QDialog):
     """Dialog for selecting videos and reviewing batch estimates."""
@@ -98,6 +271,11 @@ class BatchPreviewDialog(QDialog):
         self.filter_edit = QLineEdit()
         self.filter_edit.setPlaceholderText("Search by title, artist, codec...")
         self.filter_edit.textChanged.connect(self._on_filter_changed)
+        # Re-filter once typing pauses rather than on every keystroke.
+        self._filter_timer = QtCore.QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._apply_filter)
         filter_layout.addWidget(self.filter_edit)
         
         self.btn_select_all = QPushButton("Select All")
@@ -110,24 +288,24 @@ class BatchPreviewDialog(QDialog):
         
         layout.addLayout(filter_layout)
 
-        # 3. Table
-        self.table = QTableWidget()
-        headers = ["", "Type", "Title", "Artist", "Codec"]
+        # 3. Table (model/proxy are attached in _load_data)
+        self._headers = ["", "Type", "Title", "Artist", "Codec"]
         if self.summary.target_codec in ("h264", "hevc"):
-            headers.extend(["Profile", "PixFmt"])
-        headers.extend(["Resolution", "FPS", "Container"])
+            self._headers.extend(["Profile", "PixFmt"])
+        self._headers.extend(["Resolution", "FPS", "Container"])
         if self.summary.target_bitrate_kbps:
-            headers.append("Bitrate")
-        headers.extend(["Size", "Est. Output"])
-        
-        self.table.setColumnCount(len(headers))
-        self.table.setHorizontalHeaderLabels(headers)
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
-        self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
-        self.table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)
+            self._headers.append("Bitrate")
+        self._headers.extend(["Size", "Est. Output"])
+
+        self.table = QTableView()
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-        self.table.itemChanged.connect(self._on_item_changed)
+        # Uniform, fixed row heights: the view can then lay out and scroll any number
+        # of rows without asking the model for per-row size hints.
+        self.table.setWordWrap(False)
+        vertical_header = self.table.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(self.table.fontMetrics().height() + 8)
         layout.addWidget(self.table)
 
         # 4. Statistics Panel
@@ -171,72 +349,68 @@ class BatchPreviewDialog(QDialog):
         layout.addLayout(button_layout)
 
     def _load_data(self) -> None:
-        """Populate table with candidate videos."""
-        self.table.setRowCount(len(self.candidates))
-        self.table.blockSignals(True)
-        
-        for i, c in enumerate(self.candidates):
-            # Checkbox
-            cb_item = QTableWidgetItem()
-            cb_item.setCheckState(QtCore.Qt.CheckState.Checked if c.selected else QtCore.Qt.CheckState.Unchecked)
-            cb_item.setData(QtCore.Qt.ItemDataRole.UserRole, i)
-            self.table.setItem(i, 0, cb_item)
-
-            media_type = getattr(c, "media_type", "video")
-            self.table.setItem(i, 1, QTableWidgetItem("Audio" if media_type == "audio" else "Video"))
-            self.table.setItem(i, 2, QTableWidgetItem(c.song_title))
-            self.table.setItem(i, 3, QTableWidgetItem(c.artist))
-            self.table.setItem(i, 4, QTableWidgetItem(c.current_codec))
-
-            col = 5
-            if self.summary.target_codec in ("h264", "hevc"):
-                # For audio candidates, profile/pixfmt are always blank.
-                profile = "—"
-                pixfmt = "—"
-                if media_type == "video":
-                    profile = c.current_profile or "—"
-                    if c.current_codec.lower() not in ("h264", "avc", "hevc", "h265"):
-                        profile = "—"
-                    pixfmt = c.current_pixel_format or "-"
-                self.table.setItem(i, col, QTableWidgetItem(profile))
-                col += 1
-                self.table.setItem(i, col, QTableWidgetItem(pixfmt))
-                col += 1
-            
-            self.table.setItem(i, col, QTableWidgetItem(c.current_resolution))
-            col += 1
-            self.table.setItem(i, col, QTableWidgetItem(f"{c.current_fps:.1f}"))
-            col += 1
-            self.table.setItem(i, col, QTableWidgetItem(c.current_container))
-            col += 1
-            
-            if self.summary.target_bitrate_kbps:
-                bitrate_str = f"{c.current_bitrate_kbps}k" if c.current_bitrate_kbps else "-"
-                self.table.setItem(i, col, QTableWidgetItem(bitrate_str))
-                col += 1
-                
-            self.table.setItem(i, col, QTableWidgetItem(self._format_size(c.current_size_mb)))
-            col += 1
-            self.table.setItem(i, col, QTableWidgetItem(self._format_size(c.estimated_output_size_mb)))
-            
-        self.table.blockSignals(False)
+        """Populate table with candidate media files."""
+        self.model = BatchCandidateTableModel(self.candidates, self._headers, self._row_texts, self)
+        self.model.selection_changed.connect(self._update_statistics)
+
+        self.proxy = BatchCandidateFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        # Sort on a text column: checkbox toggles only change column 0, so they
+        # don't trigger a dynamic re-sort.
+        self.proxy.sort(1)
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.table.setModel(self.proxy)
+        finally:
+            self.table.setUpdatesEnabled(True)
+
+        # Size columns once after population. ResizeToContents would re-measure the
+        # column contents on every data change (each checkbox toggle, each filter).
+        # Measuring only a sample of rows keeps the remaining rows unformatted
+        # until they are painted.
+        header = self.table.horizontalHeader()
+        header.setResizeContentsPrecision(_RESIZE_SAMPLE_ROWS)
+        self.table.resizeColumnsToContents()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)
+
+    def _row_texts(self, c: BatchTranscodeCandidate) -> list[str]:
+        """Build the display text for each column of a candidate row (column 0 is the checkbox)."""
+        media_type = getattr(c, "media_type", "video")
+        texts = ["", "Audio" if media_type == "audio" else "Video", c.song_title, c.artist, c.current_codec]
+
+        if self.summary.target_codec in ("h264", "hevc"):
+            # For audio candidates, profile/pixfmt are always blank.
+            profile = "—"
+            pixfmt = "—"
+            if media_type == "video":
+                profile = c.current_profile or "—"
+                if c.current_codec.lower() not in ("h264", "avc", "hevc", "h265"):
+                    profile = "—"
+                pixfmt = c.current_pixel_format or "-"
+            texts.extend([profile, pixfmt])
+
+        texts.extend([c.current_resolution, f"{c.current_fps:.1f}", c.current_container])
+
+        if self.summary.target_bitrate_kbps:
+            texts.append(f"{c.current_bitrate_kbps}k" if c.current_bitrate_kbps else "-")
+
+        texts.extend([self._format_size(c.current_size_mb), self._format_size(c.estimated_output_size_mb)])
+        return texts
 
     def _update_statistics(self) -> None:
         """Recalculate statistics based on current selection."""
-        visible_count = 0
-        for i in range(self.table.rowCount()):
-            if not self.table.isRowHidden(i):
-                visible_count += 1
+        visible_count = self.proxy.rowCount()
 
-        selected_candidates = [c for c in self.candidates if c.selected]
-        selected_count = len(selected_candidates)
-        
-        total_time = sum(c.estimated_time_seconds for c in selected_candidates)
+        selected_count = self.model.selected_count
+        total_time = self.model.selected_time_seconds
         
         # Disk space calculation
         from .batch_estimator import BatchEstimator
-        required_space = BatchEstimator.calculate_disk_space_required(
-            self.candidates,
+        required_space = BatchEstimator.disk_space_for_totals(
+            self.model.selected_output_mb,
+            self.model.selected_current_mb,
             self.cb_rollback.isChecked(),
             self.summary.rollback_enabled # This is a bit redundant but follows architecture
         )
@@ -271,55 +445,55 @@ class BatchPreviewDialog(QDialog):
         return f"{size_mb:.2f} MB"
 
     def _on_filter_changed(self, text: str) -> None:
-        """Filter table rows based on search text."""
-        text = text.lower()
-        self.table.blockSignals(True)
-        for i in range(self.table.rowCount()):
-            match = False
-            for j in range(1, self.table.columnCount()):
-                item = self.table.item(i, j)
-                if item and text in item.text().lower():
-                    match = True
-                    break
-            self.table.setRowHidden(i, not match)
-            if not match:
-                item = self.table.item(i, 0)
-                item.setCheckState(QtCore.Qt.CheckState.Unchecked)
-                idx = item.data(QtCore.Qt.ItemDataRole.UserRole)
-                self.candidates[idx].selected = False
-        self.table.blockSignals(False)
+        """Schedule a (debounced) filter update for the new search text."""
+        self._filter_timer.start()
+
+    def _apply_filter(self) -> None:
+        """Filter table rows based on search text; hidden rows are deselected."""
+        text = self.filter_edit.text()
+        # Suppress repaints while rows are re-filtered and deselected; paint once at the end.
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.proxy.set_search_text(text)
+            # Only selected rows can need deselecting; test the filter just for those.
+            self.model.set_selected_rows(
+                [row for row, c in enumerate(self.candidates) if c.selected and not self.proxy.accepts(row)],
+                False,
+            )
+        finally:
+            self.table.setUpdatesEnabled(True)
         self._update_statistics()
 
     def _on_select_all(self) -> None:
         """Select all visible rows."""
-        self.table.blockSignals(True)
-        for i in range(self.table.rowCount()):
-            if not self.table.isRowHidden(i):
-                item = self.table.item(i, 0)
-                item.setCheckState(QtCore.Qt.CheckState.Checked)
-                idx = item.data(QtCore.Qt.ItemDataRole.UserRole)
-                self.candidates[idx].selected = True
-        self.table.blockSignals(False)
-        self._update_statistics()
+        self._set_visible_selected(True)
 
     def _on_deselect_all(self) -> None:
         """Deselect all visible rows."""
-        self.table.blockSignals(True)
-        for i in range(self.table.rowCount()):
-            if not self.table.isRowHidden(i):
-                item = self.table.item(i, 0)
-                item.setCheckState(QtCore.Qt.CheckState.Unchecked)
-                idx = item.data(QtCore.Qt.ItemDataRole.UserRole)
-                self.candidates[idx].selected = False
-        self.table.blockSignals(False)
+        self._set_visible_selected(False)
+
+    def _set_visible_selected(self, selected: bool) -> None:
+        """Apply a selection state to every row passing the current filter."""
+        self.table.setUpdatesEnabled(False)
+        try:
+            # Walk the source rows directly; no proxy index round-trips per row.
+            self.model.set_selected_rows(
+                [row for row, c in enumerate(self.candidates) if c.selected != selected and self.proxy.accepts(row)],
+                selected,
+            )
+        finally:
+            self.table.setUpdatesEnabled(True)
         self._update_statistics()
 
-    def _on_item_changed(self, item: QTableWidgetItem) -> None:
-        """Handle checkbox state change."""
-        if item.column() == 0:
-            idx = item.data(QtCore.Qt.ItemDataRole.UserRole)
-            self.candidates[idx].selected = (item.checkState() == QtCore.Qt.CheckState.Checked)
-            self._update_statistics()
+    def accept(self) -> None:
+        """Apply a still-pending filter before closing so hidden rows are deselected."""
+        if self._filter_timer.isActive():
+            self._filter_timer.stop()
+            self._apply_filter()
+            if not self.btn_start.isEnabled():
+                # The final filter left nothing startable; keep the dialog open.
+                return
+        super().accept()
 
     def get_selected_candidates(self) -> list[BatchTranscodeCandidate]:
         """Return list of selected candidates."""
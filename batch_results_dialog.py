@@ -27,6 +27,16 @@ if TYPE_CHECKING:
 
 _logger = logging.getLogger(__name__)
 
+# Status column symbol and colour per candidate status; brushes are built once
+# rather than parsing a colour name for every row.
+_STATUS_DISPLAY: dict[str, tuple[str, QtGui.QBrush]] = {
+    "success": ("✓", QtGui.QBrush(QtGui.QColor("green"))),
+    "failed": ("✗", QtGui.QBrush(QtGui.QColor("red"))),
+    "aborted": ("⊘", QtGui.QBrush(QtGui.QColor("orange"))),
+    "rolled_back": ("↺", QtGui.QBrush(QtGui.QColor("blue"))),
+}
+_OTHER_STATUS_DISPLAY = ("⊙", QtGui.QBrush(QtGui.QColor("gray")))
+
 
 class BatchResultsDialog(QDialog):
     """Dialog showing batch transcode results."""
@@ -40,10 +50,16 @@ class BatchResultsDialog(QDialog):
     ):
         super().__init__(parent)
         self.candidates = candidates
-        # Only show media files that were actually selected for transcoding
-        self.processed_candidates = [c for c in candidates if c.selected]
+        # Only show media files that were actually selected for transcoding, listed
+        # by artist and title rather than processing order
+        self.processed_candidates = sorted(
+            (c for c in candidates if c.selected), key=lambda c: c.display_sort_key
+        )
         self.summary = summary
         self.aborted = aborted
+        # Output sizes are needed by the table, CSV export and clipboard copy;
+        # stat each output file once up front.
+        self._output_sizes_mb = [self._output_size_mb(c) for c in self.processed_candidates]
         self._setup_ui()
         self._load_results()
 
@@ -179,38 +195,18 @@ class BatchResultsDialog(QDialog):
         """Populate table with results."""
         self.table.setRowCount(len(self.processed_candidates))
         
-        for i, c in enumerate(self.processed_candidates):
+        for i, (c, new_size) in enumerate(zip(self.processed_candidates, self._output_sizes_mb)):
             # Status icon
-            status_item = QTableWidgetItem()
-            if c.status == "success":
-                status_item.setText("✓")
-                status_item.setForeground(QtGui.QColor("green"))
-            elif c.status == "failed":
-                status_item.setText("✗")
-                status_item.setForeground(QtGui.QColor("red"))
-            elif c.status == "aborted":
-                status_item.setText("⊘")
-                status_item.setForeground(QtGui.QColor("orange"))
-            elif c.status == "rolled_back":
-                status_item.setText("↺")
-                status_item.setForeground(QtGui.QColor("blue"))
-            else:
-                status_item.setText("⊙")
-                status_item.setForeground(QtGui.QColor("gray"))
+            symbol, brush = _STATUS_DISPLAY.get(c.status, _OTHER_STATUS_DISPLAY)
+            status_item = QTableWidgetItem(symbol)
+            status_item.setForeground(brush)
             self.table.setItem(i, 0, status_item)
             
             self.table.setItem(i, 1, QTableWidgetItem(c.song_title))
             self.table.setItem(i, 2, QTableWidgetItem(c.artist))
             
             # Change info
-            change = "-"
-            if c.status == "success" and c.result and c.result.output_path and c.result.output_path.exists():
-                new_size = c.result.output_path.stat().st_size / (1024 * 1024)
-                target_codec = self.summary.target_codec
-                if getattr(c, "media_type", "video") == "audio":
-                    target_codec = self.summary.target_audio_codec
-                change = f"{c.current_codec} → {target_codec}, {c.current_size_mb:.1f}MB → {new_size:.1f}MB"
-            self.table.setItem(i, 3, QTableWidgetItem(change))
+            self.table.setItem(i, 3, QTableWidgetItem(self._format_change(c, new_size)))
             
             # Error message
             self.table.setItem(i, 4, QTableWidgetItem(c.error_message or "—"))
@@ -236,10 +232,8 @@ class BatchResultsDialog(QDialog):
             with open(path, "w", newline="", encoding="utf-8") as f:
                 writer = csv.writer(f)
                 writer.writerow(["Status", "Title", "Artist", "Current Codec", "Target Codec", "Original Size (MB)", "New Size (MB)", "Time (s)", "Error"])
-                for c in self.processed_candidates:
-                    new_size = ""
-                    if c.status == "success" and c.result and c.result.output_path and c.result.output_path.exists():
-                        new_size = f"{c.result.output_path.stat().st_size / (1024 * 1024):.2f}"
+                for c, output_size in zip(self.processed_candidates, self._output_sizes_mb):
+                    new_size = f"{output_size:.2f}" if output_size is not None else ""
                     
                     writer.writerow([
                         c.status,
@@ -263,20 +257,32 @@ class BatchResultsDialog(QDialog):
     def _copy_to_clipboard(self) -> None:
         """Copy results to clipboard."""
         lines = ["Status\tTitle\tArtist\tChange\tError"]
-        for c in self.processed_candidates:
-            change = "-"
-            if c.status == "success" and c.result and c.result.output_path and c.result.output_path.exists():
-                new_size = c.result.output_path.stat().st_size / (1024 * 1024)
-                target_codec = self.summary.target_codec
-                if getattr(c, "media_type", "video") == "audio":
-                    target_codec = self.summary.target_audio_codec
-                change = f"{c.current_codec} → {target_codec}, {c.current_size_mb:.1f}MB → {new_size:.1f}MB"
-            
+        for c, new_size in zip(self.processed_candidates, self._output_sizes_mb):
+            change = self._format_change(c, new_size)
             lines.append(f"{c.status}\t{c.song_title}\t{c.artist}\t{change}\t{c.error_message or ''}")
             
         QtWidgets.QApplication.clipboard().setText("\n".join(lines))
         QtWidgets.QMessageBox.information(self, "Copied", "Results copied to clipboard.")
 
+    @staticmethod
+    def _output_size_mb(c: BatchTranscodeCandidate) -> Optional[float]:
+        """Return the size of a successful item's output in MB, or None."""
+        if c.status != "success" or not c.result or not c.result.output_path:
+            return None
+        try:
+            return c.result.output_path.stat().st_size / (1024 * 1024)
+        except OSError:
+            return None
+
+    def _format_change(self, c: BatchTranscodeCandidate, new_size: Optional[float]) -> str:
+        """Describe the codec/size change of an item, or "-" if it produced no output."""
+        if new_size is None:
+            return "-"
+        target_codec = self.summary.target_codec
+        if getattr(c, "media_type", "video") == "audio":
+            target_codec = self.summary.target_audio_codec
+        return f"{c.current_codec} → {target_codec}, {c.current_size_mb:.1f}MB → {new_size:.1f}MB"
+
     def _format_duration(self, seconds: float) -> str:
         """Format seconds as HH:MM:SS."""
         h = int(seconds // 3600)
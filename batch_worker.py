@@ -29,42 +29,38 @@ _logger = logging.getLogger(__name__)
 class BatchAbortRegistry:
     """Thread-safe registry for batch transcode abort flags.
     
-    This singleton class maintains abort flags for videos currently being
-    transcoded in batch operations, allowing the UI abort signal to reach
+    A single module-level instance maintains abort flags for videos currently
+    being transcoded in batch operations, allowing the UI abort signal to reach
     the FFmpeg execution layer.
-    """
 
-    _instance: Optional[BatchAbortRegistry] = None
-    _lock = threading.Lock()
+    Writers take a lock; ``is_aborted`` is polled from the FFmpeg progress loop
+    and reads without it, since a membership test on a builtin set is atomic
+    in CPython.
+    """
 
     def __init__(self) -> None:
-        self._abort_flags: dict[SongId, bool] = {}
+        self._abort_flags: set[SongId] = set()
         self._flags_lock = threading.Lock()
 
     @classmethod
     def instance(cls) -> BatchAbortRegistry:
-        """Get singleton instance with double-checked locking."""
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = cls()
-        return cls._instance
+        """Get the shared registry instance."""
+        return _BATCH_ABORT_REGISTRY
 
     def set_abort(self, song_id: SongId) -> None:
         """Mark the given song for abort."""
         with self._flags_lock:
-            self._abort_flags[song_id] = True
+            self._abort_flags.add(song_id)
             _logger.debug(f"Set abort flag for song {song_id}")
 
     def is_aborted(self, song_id: SongId) -> bool:
         """Check if abort has been requested for the given song."""
-        with self._flags_lock:
-            return self._abort_flags.get(song_id, False)
+        return song_id in self._abort_flags
 
     def clear(self, song_id: SongId) -> None:
         """Clear abort flag for the given song."""
         with self._flags_lock:
-            self._abort_flags.pop(song_id, None)
+            self._abort_flags.discard(song_id)
             _logger.debug(f"Cleared abort flag for song {song_id}")
 
     def clear_all(self) -> None:
@@ -74,6 +70,9 @@ class BatchAbortRegistry:
             _logger.debug("Cleared all batch abort flags")
 
 
+_BATCH_ABORT_REGISTRY = BatchAbortRegistry()
+
+
 class BatchWorker(QtCore.QThread):
     """Worker thread for batch transcoding."""
 
@@ -105,6 +104,10 @@ class BatchWorker(QtCore.QThread):
             BatchAbortRegistry.instance().set_abort(self._current_song_id)
             _logger.info(f"Abort requested for currently transcoding song {self._current_song_id}")
 
+    def _on_progress(self, percent: float, fps: float, speed: str, elapsed: float, eta: float) -> None:
+        """Forward transcode progress of the current item to the UI."""
+        self.video_progress.emit(percent, fps, speed, elapsed, eta)
+
     def run(self) -> None:
         """Execute batch transcode."""
         try:
@@ -112,9 +115,19 @@ class BatchWorker(QtCore.QThread):
             db.connect(AppPaths.db)
 
             selected_candidates = [c for c in self.candidates if c.selected]
+            registry = BatchAbortRegistry.instance()
             _logger.info(f"Starting batch transcode of {len(selected_candidates)} selected candidates (out of {len(self.candidates)} total)")
-            
+
+            # Video and audio candidates of the same song share one database lookup.
+            songs: dict[SongId, Optional[UsdbSong]] = {}
+
             for i, candidate in enumerate(self.candidates):
+                # Unselected items never reach FFmpeg: skip them before the (comparatively
+                # expensive) per-song abort lookup, unless the whole batch is being aborted.
+                if not candidate.selected and not self._abort_requested:
+                    candidate.status = "skipped"
+                    continue
+
                 if self._abort_requested or is_aborted(candidate.song_id):
                     if candidate.selected:
                         _logger.info(f"Batch transcode aborted by user at candidate {i} ({candidate.song_title})")
@@ -127,10 +140,6 @@ class BatchWorker(QtCore.QThread):
                     self.batch_aborted.emit()
                     return
 
-                if not candidate.selected:
-                    candidate.status = "skipped"
-                    continue
-
                 candidate.status = "transcoding"
                 self.video_started.emit(candidate.song_title, candidate.artist)
                 self._current_song_id = candidate.song_id
@@ -138,16 +147,15 @@ class BatchWorker(QtCore.QThread):
                 start_time = time.time()
                 
                 try:
-                    song = UsdbSong.get(candidate.song_id)
+                    if candidate.song_id in songs:
+                        song = songs[candidate.song_id]
+                    else:
+                        song = songs[candidate.song_id] = UsdbSong.get(candidate.song_id)
                     if not song:
                         raise ValueError(f"Song {candidate.song_id} not found in database")
 
                     slog = song_logger(candidate.song_id)
 
-                    # Progress callback for process_video
-                    def progress_callback(percent: float, fps: float, speed: str, elapsed: float, eta: float) -> None:
-                        self.video_progress.emit(percent, fps, speed, elapsed, eta)
-
                     # Perform the transcode (video or audio)
                     if getattr(candidate, "media_type", "video") == "audio":
                         result = process_audio(
@@ -155,7 +163,7 @@ class BatchWorker(QtCore.QThread):
                             media_path=candidate.video_path,
                             cfg=self.cfg,
                             slog=slog,
-                            progress_callback=progress_callback,
+                            progress_callback=self._on_progress,
                         )
                     else:
                         result = process_video(
@@ -163,7 +171,7 @@ class BatchWorker(QtCore.QThread):
                             video_path=candidate.video_path,
                             cfg=self.cfg,
                             slog=slog,
-                            progress_callback=progress_callback
+                            progress_callback=self._on_progress
                         )
                     
                     candidate.actual_time_seconds = time.time() - start_time
@@ -198,7 +206,7 @@ class BatchWorker(QtCore.QThread):
                         error_message=str(e)
                     ))
                 finally:
-                    BatchAbortRegistry.instance().clear(candidate.song_id)
+                    registry.clear(candidate.song_id)
                     self._current_song_id = None
 
             _logger.info("Batch transcode completed")
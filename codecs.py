@@ -13,6 +13,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Dict, Iterable, Tuple, Type
 
@@ -22,7 +23,7 @@ if TYPE_CHECKING:
     from .video_analyzer import VideoInfo
 
 
-@dataclass
+@dataclass(frozen=True)
 class CodecCapabilities:
     """Describes a codec handler's capabilities."""
     name: str                          # e.g., "h264", "vp8", "hevc"
@@ -33,6 +34,19 @@ class CodecCapabilities:
     unity_compatible: bool             # Supported by Unity 6 VideoPlayer
 
 
+# Input codec name -> QSV decoder
+_QSV_DECODERS: dict[str, str] = {
+    "h264": "h264_qsv",
+    "hevc": "hevc_qsv",
+    "h265": "hevc_qsv",
+    "vp9": "vp9_qsv",
+    "mpeg2video": "mpeg2_qsv",
+    "vc1": "vc1_qsv",
+    "av1": "av1_qsv",
+    "mjpeg": "mjpeg_qsv",
+}
+
+
 class CodecHandler(ABC):
     """Abstract base class for codec handlers."""
 
@@ -53,8 +67,14 @@ class CodecHandler(ABC):
         accel: type["HardwareAccelerator"] | None,
         hw_encode_enabled: bool = False,
         hw_decode_enabled: bool = False,
+        start_time: float | None = None,
+        duration: float | None = None,
     ) -> list[str]:
-        """Build FFMPEG command for encoding to this codec."""
+        """Build FFMPEG command for encoding to this codec.
+
+        start_time/duration optionally restrict the encode to a segment of the
+        input (in seconds); by default the whole input is encoded.
+        """
         ...
 
     @classmethod
@@ -66,17 +86,7 @@ class CodecHandler(ABC):
     @classmethod
     def get_qsv_decoder(cls, video_info: VideoInfo) -> str | None:
         """Return QSV decoder name for input codec, or None."""
-        codec_to_decoder = {
-            "h264": "h264_qsv",
-            "hevc": "hevc_qsv",
-            "h265": "hevc_qsv",
-            "vp9": "vp9_qsv",
-            "mpeg2video": "mpeg2_qsv",
-            "vc1": "vc1_qsv",
-            "av1": "av1_qsv",
-            "mjpeg": "mjpeg_qsv",
-        }
-        return codec_to_decoder.get(video_info.codec_name.lower())
+        return _QSV_DECODERS.get(video_info.codec_name)
 
     @classmethod
     def get_hw_decoder(
@@ -110,25 +120,152 @@ def get_codec_handler(codec_name: str) -> Type[CodecHandler] | None:
     return CODEC_REGISTRY.get(codec_name)
 
 
+# Constant argument fragments shared by the command builders.
+_FFMPEG_PREAMBLE = ("ffmpeg", "-y", "-hide_banner")
+_FASTSTART_MOVFLAGS = ("-movflags", "+faststart")
+_VSYNC_CFR = ("-vsync", "cfr")
+_AUDIO_COPY = ("-c:a", "copy")
+_NO_AUDIO = ("-an",)
+_AAC_192K = ("-c:a", "aac", "-b:a", "192k")
+_OPUS_160K = ("-c:a", "libopus", "-b:a", "160k")
+
+
+def _input_args(input_path: Path, start_time: float | None, duration: float | None) -> list[str]:
+    """Return the -i arguments, optionally limited to a segment of the input."""
+    args: list[str] = []
+    if start_time:
+        # -ss before -i seeks in the demuxer and skips straight to the nearest
+        # keyframe; after -i it would decode and discard every frame up to it.
+        args.extend(["-ss", str(start_time)])
+    args.extend(["-i", str(input_path)])
+    if duration is not None:
+        args.extend(["-t", str(duration)])
+    return args
+
+
+# NVENC quality options: spatial/temporal adaptive quantization, lookahead and
+# quarter-resolution two-pass. They run inside the encoder at little speed cost.
+_NVENC_QUALITY_ARGS = (
+    "-spatial-aq", "1",
+    "-temporal-aq", "1",
+    "-rc-lookahead", "32",
+    "-b_ref_mode", "middle",
+    "-multipass", "qres",
+)
+# av1_nvenc has no b_ref_mode; it splits frames into tiles instead.
+_NVENC_AV1_QUALITY_ARGS = (
+    "-spatial-aq", "1",
+    "-temporal-aq", "1",
+    "-rc-lookahead", "32",
+    "-multipass", "qres",
+    "-tile-columns", "2",
+    "-tile-rows", "1",
+)
+
+
+def _nvenc_quality_args(
+    cfg: TranscoderConfig,
+    accel: type["HardwareAccelerator"],
+    encoder: str,
+) -> tuple[str, ...]:
+    """Return the NVENC quality options for encoder.
+
+    Returns nothing when disabled in the config or when the GPU/driver rejects
+    them (older NVENC generations lack temporal AQ and B-frame references).
+    """
+    if not cfg.nvenc.quality_flags:
+        return ()
+    args = _NVENC_AV1_QUALITY_ARGS if encoder == "av1_nvenc" else _NVENC_QUALITY_ARGS
+    return args if accel.supports_encoder_options(encoder, args) else ()
+
+
+@lru_cache(maxsize=16)
+def _bitrate_args(max_kbps: int) -> tuple[str, ...]:
+    """Return the maxrate/bufsize arguments for a bitrate cap (buffer = 2x the cap)."""
+    return ("-maxrate", f"{max_kbps}k", "-bufsize", f"{max_kbps * 2}k")
+
+
+@lru_cache(maxsize=32)
+def _build_video_filters(
+    max_resolution: tuple[int, int] | None,
+    max_fps: int | None,
+    pad_to_resolution: bool,
+) -> str | None:
+    """Return the -vf chain for the resolution/FPS caps, or None if no filtering is needed.
+
+    With pad_to_resolution the video is scaled to fit and padded to exactly
+    max_resolution; otherwise it is only scaled down (never up) to fit.
+    Cached because the same settings are used for every file of a batch.
+    """
+    vf: list[str] = []
+    # Filters run left to right: drop frames with fps first so the scaler only
+    # processes frames that are actually kept.
+    if max_fps:
+        vf.append(f"fps=fps={int(max_fps)}")
+    if max_resolution:
+        max_w, max_h = int(max_resolution[0]), int(max_resolution[1])
+        if pad_to_resolution:
+            vf.append(
+                f"scale={max_w}:{max_h}:force_original_aspect_ratio=decrease,pad={max_w}:{max_h}:(ow-iw)/2:(oh-ih)/2"
+            )
+        else:
+            vf.append(f"scale='min(iw,{max_w})':'min(ih,{max_h})':force_original_aspect_ratio=decrease")
+    return ",".join(vf) if vf else None
+
+
+def _video_filter_args(cfg: TranscoderConfig, pad_to_resolution: bool) -> list[str]:
+    """Return the ["-vf", chain] arguments for the configured caps (empty if none)."""
+    max_resolution = cfg.general.max_resolution
+    vf = _build_video_filters(
+        tuple(max_resolution) if max_resolution else None,
+        cfg.general.max_fps or None,
+        pad_to_resolution,
+    )
+    return ["-vf", vf] if vf else []
+
+
+def _build_audio_args(video_info: VideoInfo, mp4_family: bool) -> tuple[str, ...]:
+    """Return audio arguments for a video output.
+
+    The source audio is stream-copied when the target container family accepts it
+    (MP4/MOV: AAC, MP3, ALAC; WebM/MKV: Opus, Vorbis), otherwise re-encoded to
+    AAC 192k or Opus 160k respectively.
+    """
+    if not video_info.has_audio:
+        return _NO_AUDIO
+    if mp4_family:
+        if video_info.audio_codec in ("aac", "mp3", "alac"):
+            return _AUDIO_COPY
+        return _AAC_192K
+    if video_info.audio_codec in ("opus", "vorbis"):
+        return _AUDIO_COPY
+    return _OPUS_160K
+
+
 @register_codec
 class H264Handler(CodecHandler):
     """Handler for H.264/AVC encoding."""
 
+    # Input codec names (lowercase, as reported by ffprobe) this handler targets.
+    _COMPATIBLE_CODECS: frozenset[str] = frozenset({"h264", "avc"})
+
+    _CAPABILITIES = CodecCapabilities(
+        name="h264",
+        display_name="H.264/AVC",
+        container="mp4",
+        supports_quicksync_encode=True,
+        supports_quicksync_decode=True,
+        unity_compatible=True,
+    )
+
     @classmethod
     def capabilities(cls) -> CodecCapabilities:
-        return CodecCapabilities(
-            name="h264",
-            display_name="H.264/AVC",
-            container="mp4",
-            supports_quicksync_encode=True,
-            supports_quicksync_decode=True,
-            unity_compatible=True,
-        )
+        return cls._CAPABILITIES
 
     @classmethod
     def is_compatible(cls, video_info: VideoInfo) -> bool:
         """Check if already H.264 with Unity-compatible settings."""
-        if video_info.codec_name.lower() not in ("h264", "avc"):
+        if video_info.codec_name not in cls._COMPATIBLE_CODECS:
             return False
         if video_info.pixel_format != "yuv420p":
             return False
@@ -146,19 +283,32 @@ class H264Handler(CodecHandler):
         accel: type["HardwareAccelerator"] | None,
         hw_encode_enabled: bool = False,
         hw_decode_enabled: bool = False,
+        start_time: float | None = None,
+        duration: float | None = None,
     ) -> list[str]:
         h264_cfg = cfg.h264
-        cmd = ["ffmpeg", "-y", "-hide_banner"]
+        cmd = list(_FFMPEG_PREAMBLE)
 
         # Hardware decoder if available and enabled
         if hw_decode_enabled:
             if decoder := cls.get_hw_decoder(video_info, accel):
                 cmd.extend(["-c:v", decoder])
 
-        cmd.extend(["-i", str(input_path)])
+        cmd.extend(_input_args(input_path, start_time, duration))
 
         # Encoder selection
-        if hw_encode_enabled and accel is not None:
+        if hw_encode_enabled and accel is not None and accel.capabilities().name == "nvenc":
+            cmd.extend([
+                "-c:v", "h264_nvenc",
+                "-preset", "p4",
+                "-profile:v", h264_cfg.profile,
+                "-rc", "vbr",
+                "-cq", str(h264_cfg.crf),
+                "-b:v", "0",
+                "-pix_fmt", "yuv420p",
+            ])
+            cmd.extend(_nvenc_quality_args(cfg, accel, "h264_nvenc"))
+        elif hw_encode_enabled and accel is not None:
             cmd.extend([
                 "-c:v", "h264_qsv",
                 "-preset", h264_cfg.preset,
@@ -176,46 +326,19 @@ class H264Handler(CodecHandler):
                 "-pix_fmt", h264_cfg.pixel_format,
             ])
 
-        # Common settings
-        cmd.extend([
-            "-vsync", "cfr",
-        ])
+        cmd.extend(_VSYNC_CFR)
+
         # Optional caps
         if cfg.general.max_bitrate_kbps:
-            max_k = int(cfg.general.max_bitrate_kbps)
-            cmd.extend(["-maxrate", f"{max_k}k", "-bufsize", f"{max_k * 2}k"])
-
-        vf: list[str] = []
-        if cfg.general.max_resolution:
-            max_w, max_h = cfg.general.max_resolution
-            if cfg.usdb_integration.use_usdb_resolution:
-                vf.append(
-                    "scale='min(iw,{})':'min(ih,{})':force_original_aspect_ratio=decrease".format(
-                        int(max_w), int(max_h)
-                    )
-                )
-            else:
-                vf.append(
-                    "scale={}:{}:force_original_aspect_ratio=decrease,pad={}:{}:(ow-iw)/2:(oh-ih)/2".format(
-                        int(max_w), int(max_h), int(max_w), int(max_h)
-                    )
-                )
-        if cfg.general.max_fps:
-            vf.append(f"fps=fps={int(cfg.general.max_fps)}")
-        if vf:
-            cmd.extend(["-vf", ",".join(vf)])
+            cmd.extend(_bitrate_args(int(cfg.general.max_bitrate_kbps)))
+
+        cmd.extend(_video_filter_args(cfg, pad_to_resolution=not cfg.usdb_integration.use_usdb_resolution))
 
         # Audio handling - Fix MP4 compatibility
-        if video_info.has_audio:
-            if video_info.audio_codec in ("aac", "mp3", "alac"):
-                cmd.extend(["-c:a", "copy"])
-            else:
-                cmd.extend(["-c:a", "aac", "-b:a", "192k"])
-        else:
-            cmd.extend(["-an"])
+        cmd.extend(_build_audio_args(video_info, mp4_family=True))
 
         if output_path.suffix.lower() in (".mp4", ".mov"):
-            cmd.extend(["-movflags", "+faststart"])
+            cmd.extend(_FASTSTART_MOVFLAGS)
 
         cmd.append(str(output_path))
         return cmd
@@ -225,20 +348,24 @@ class H264Handler(CodecHandler):
 class VP8Handler(CodecHandler):
     """Handler for VP8 encoding."""
 
+    _COMPATIBLE_CODECS: frozenset[str] = frozenset({"vp8"})
+
+    _CAPABILITIES = CodecCapabilities(
+        name="vp8",
+        display_name="VP8",
+        container="webm",
+        supports_quicksync_encode=False,
+        supports_quicksync_decode=False,
+        unity_compatible=True,
+    )
+
     @classmethod
     def capabilities(cls) -> CodecCapabilities:
-        return CodecCapabilities(
-            name="vp8",
-            display_name="VP8",
-            container="webm",
-            supports_quicksync_encode=False,
-            supports_quicksync_decode=False,
-            unity_compatible=True,
-        )
+        return cls._CAPABILITIES
 
     @classmethod
     def is_compatible(cls, video_info: VideoInfo) -> bool:
-        return video_info.codec_name.lower() == "vp8"
+        return video_info.codec_name in cls._COMPATIBLE_CODECS
 
     @classmethod
     def build_encode_command(
@@ -250,16 +377,18 @@ class VP8Handler(CodecHandler):
         accel: type["HardwareAccelerator"] | None,
         hw_encode_enabled: bool = False,
         hw_decode_enabled: bool = False,
+        start_time: float | None = None,
+        duration: float | None = None,
     ) -> list[str]:
         vp8_cfg = cfg.vp8
-        cmd = ["ffmpeg", "-y", "-hide_banner"]
+        cmd = list(_FFMPEG_PREAMBLE)
 
         # Hardware decoder if available
         if hw_decode_enabled:
             if decoder := cls.get_hw_decoder(video_info, accel):
                 cmd.extend(["-c:v", decoder])
 
-        cmd.extend(["-i", str(input_path)])
+        cmd.extend(_input_args(input_path, start_time, duration))
 
         cmd.extend([
             "-c:v", "libvpx",
@@ -270,41 +399,17 @@ class VP8Handler(CodecHandler):
             "-auto-alt-ref", "1",
             "-lag-in-frames", "16",
             "-pix_fmt", "yuv420p",
-            "-vsync", "cfr",
         ])
 
+        cmd.extend(_VSYNC_CFR)
+
         # Optional caps
         if cfg.general.max_bitrate_kbps:
-            max_k = int(cfg.general.max_bitrate_kbps)
-            cmd.extend(["-maxrate", f"{max_k}k", "-bufsize", f"{max_k * 2}k"])
-
-        vf: list[str] = []
-        if cfg.general.max_resolution:
-            max_w, max_h = cfg.general.max_resolution
-            if cfg.usdb_integration.use_usdb_resolution:
-                vf.append(
-                    "scale='min(iw,{})':'min(ih,{})':force_original_aspect_ratio=decrease".format(
-                        int(max_w), int(max_h)
-                    )
-                )
-            else:
-                vf.append(
-                    "scale={}:{}:force_original_aspect_ratio=decrease,pad={}:{}:(ow-iw)/2:(oh-ih)/2".format(
-                        int(max_w), int(max_h), int(max_w), int(max_h)
-                    )
-                )
-        if cfg.general.max_fps:
-            vf.append(f"fps=fps={int(cfg.general.max_fps)}")
-        if vf:
-            cmd.extend(["-vf", ",".join(vf)])
-
-        if video_info.has_audio:
-            if video_info.audio_codec in ("opus", "vorbis"):
-                cmd.extend(["-c:a", "copy"])
-            else:
-                cmd.extend(["-c:a", "libopus", "-b:a", "160k"])
-        else:
-            cmd.extend(["-an"])
+            cmd.extend(_bitrate_args(int(cfg.general.max_bitrate_kbps)))
+
+        cmd.extend(_video_filter_args(cfg, pad_to_resolution=not cfg.usdb_integration.use_usdb_resolution))
+
+        cmd.extend(_build_audio_args(video_info, mp4_family=False))
 
         cmd.append(str(output_path))
         return cmd
@@ -314,20 +419,24 @@ class VP8Handler(CodecHandler):
 class HEVCHandler(CodecHandler):
     """Handler for HEVC/H.265 encoding."""
 
+    _COMPATIBLE_CODECS: frozenset[str] = frozenset({"hevc", "h265"})
+
+    _CAPABILITIES = CodecCapabilities(
+        name="hevc",
+        display_name="HEVC/H.265",
+        container="mp4",
+        supports_quicksync_encode=True,
+        supports_quicksync_decode=True,
+        unity_compatible=True,
+    )
+
     @classmethod
     def capabilities(cls) -> CodecCapabilities:
-        return CodecCapabilities(
-            name="hevc",
-            display_name="HEVC/H.265",
-            container="mp4",
-            supports_quicksync_encode=True,
-            supports_quicksync_decode=True,
-            unity_compatible=True,
-        )
+        return cls._CAPABILITIES
 
     @classmethod
     def is_compatible(cls, video_info: VideoInfo) -> bool:
-        if video_info.codec_name.lower() not in ("hevc", "h265"):
+        if video_info.codec_name not in cls._COMPATIBLE_CODECS:
             return False
         if video_info.pixel_format != "yuv420p":
             return False
@@ -343,17 +452,31 @@ class HEVCHandler(CodecHandler):
         accel: type["HardwareAccelerator"] | None,
         hw_encode_enabled: bool = False,
         hw_decode_enabled: bool = False,
+        start_time: float | None = None,
+        duration: float | None = None,
     ) -> list[str]:
         hevc_cfg = cfg.hevc
-        cmd = ["ffmpeg", "-y", "-hide_banner"]
+        cmd = list(_FFMPEG_PREAMBLE)
 
         if hw_decode_enabled:
             if decoder := cls.get_hw_decoder(video_info, accel):
                 cmd.extend(["-c:v", decoder])
 
-        cmd.extend(["-i", str(input_path)])
+        cmd.extend(_input_args(input_path, start_time, duration))
 
-        if hw_encode_enabled and accel is not None:
+        if hw_encode_enabled and accel is not None and accel.capabilities().name == "nvenc":
+            cmd.extend([
+                "-c:v", "hevc_nvenc",
+                "-preset", "p4",
+                "-profile:v", hevc_cfg.profile,
+                "-rc", "vbr",
+                "-cq", str(hevc_cfg.crf),
+                "-b:v", "0",
+                "-tag:v", "hvc1",
+                "-pix_fmt", "p010le" if hevc_cfg.profile == "main10" else "yuv420p",
+            ])
+            cmd.extend(_nvenc_quality_args(cfg, accel, "hevc_nvenc"))
+        elif hw_encode_enabled and accel is not None:
             cmd.extend([
                 "-c:v", "hevc_qsv",
                 "-preset", hevc_cfg.preset,
@@ -372,44 +495,19 @@ class HEVCHandler(CodecHandler):
                 "-pix_fmt", hevc_cfg.pixel_format,
             ])
 
-        cmd.extend(["-vsync", "cfr"])
+        cmd.extend(_VSYNC_CFR)
 
         # Optional caps
         if cfg.general.max_bitrate_kbps:
-            max_k = int(cfg.general.max_bitrate_kbps)
-            cmd.extend(["-maxrate", f"{max_k}k", "-bufsize", f"{max_k * 2}k"])
-
-        vf: list[str] = []
-        if cfg.general.max_resolution:
-            max_w, max_h = cfg.general.max_resolution
-            if cfg.usdb_integration.use_usdb_resolution:
-                vf.append(
-                    "scale='min(iw,{})':'min(ih,{})':force_original_aspect_ratio=decrease".format(
-                        int(max_w), int(max_h)
-                    )
-                )
-            else:
-                vf.append(
-                    "scale={}:{}:force_original_aspect_ratio=decrease,pad={}:{}:(ow-iw)/2:(oh-ih)/2".format(
-                        int(max_w), int(max_h), int(max_w), int(max_h)
-                    )
-                )
-        if cfg.general.max_fps:
-            vf.append(f"fps=fps={int(cfg.general.max_fps)}")
-        if vf:
-            cmd.extend(["-vf", ",".join(vf)])
+            cmd.extend(_bitrate_args(int(cfg.general.max_bitrate_kbps)))
+
+        cmd.extend(_video_filter_args(cfg, pad_to_resolution=not cfg.usdb_integration.use_usdb_resolution))
 
         # Audio handling - Fix MP4 compatibility
-        if video_info.has_audio:
-            if video_info.audio_codec in ("aac", "mp3", "alac"):
-                cmd.extend(["-c:a", "copy"])
-            else:
-                cmd.extend(["-c:a", "aac", "-b:a", "192k"])
-        else:
-            cmd.extend(["-an"])
+        cmd.extend(_build_audio_args(video_info, mp4_family=True))
 
         if output_path.suffix.lower() in (".mp4", ".mov"):
-            cmd.extend(["-movflags", "+faststart"])
+            cmd.extend(_FASTSTART_MOVFLAGS)
 
         cmd.append(str(output_path))
         return cmd
@@ -419,20 +517,24 @@ class HEVCHandler(CodecHandler):
 class VP9Handler(CodecHandler):
     """Handler for VP9 encoding."""
 
+    _COMPATIBLE_CODECS: frozenset[str] = frozenset({"vp9"})
+
+    _CAPABILITIES = CodecCapabilities(
+        name="vp9",
+        display_name="VP9",
+        container="webm",
+        supports_quicksync_encode=True,
+        supports_quicksync_decode=True,
+        unity_compatible=False,
+    )
+
     @classmethod
     def capabilities(cls) -> CodecCapabilities:
-        return CodecCapabilities(
-            name="vp9",
-            display_name="VP9",
-            container="webm",
-            supports_quicksync_encode=True,
-            supports_quicksync_decode=True,
-            unity_compatible=False,
-        )
+        return cls._CAPABILITIES
 
     @classmethod
     def is_compatible(cls, video_info: VideoInfo) -> bool:
-        return video_info.codec_name.lower() == "vp9"
+        return video_info.codec_name in cls._COMPATIBLE_CODECS
 
     @classmethod
     def build_encode_command(
@@ -444,16 +546,18 @@ class VP9Handler(CodecHandler):
         accel: type["HardwareAccelerator"] | None,
         hw_encode_enabled: bool = False,
         hw_decode_enabled: bool = False,
+        start_time: float | None = None,
+        duration: float | None = None,
     ) -> list[str]:
         vp9_cfg = cfg.vp9
-        cmd = ["ffmpeg", "-y", "-hide_banner"]
+        cmd = list(_FFMPEG_PREAMBLE)
 
         # Hardware decoder if available
         if hw_decode_enabled:
             if decoder := cls.get_hw_decoder(video_info, accel):
                 cmd.extend(["-c:v", decoder])
 
-        cmd.extend(["-i", str(input_path)])
+        cmd.extend(_input_args(input_path, start_time, duration))
 
         # Encoder selection
         if hw_encode_enabled and accel is not None:
@@ -477,54 +581,54 @@ class VP9Handler(CodecHandler):
                 "-pix_fmt", "yuv420p",
             ])
 
-        cmd.extend(["-vsync", "cfr"])
+        cmd.extend(_VSYNC_CFR)
 
         # Optional caps
         if cfg.general.max_bitrate_kbps:
-            max_k = int(cfg.general.max_bitrate_kbps)
-            cmd.extend(["-maxrate", f"{max_k}k", "-bufsize", f"{max_k * 2}k"])
-
-        # Video filters
-        vf: list[str] = []
-        if cfg.general.max_resolution:
-            max_w, max_h = cfg.general.max_resolution
-            vf.append(f"scale='min(iw,{int(max_w)})':'min(ih,{int(max_h)})':force_original_aspect_ratio=decrease")
-        if cfg.general.max_fps:
-            vf.append(f"fps=fps={int(cfg.general.max_fps)}")
-        if vf:
-            cmd.extend(["-vf", ",".join(vf)])
+            cmd.extend(_bitrate_args(int(cfg.general.max_bitrate_kbps)))
+
+        cmd.extend(_video_filter_args(cfg, pad_to_resolution=False))
 
         # Audio handling - prefer Opus for WebM
-        if video_info.has_audio:
-            if video_info.audio_codec in ("opus", "vorbis"):
-                cmd.extend(["-c:a", "copy"])
-            else:
-                cmd.extend(["-c:a", "libopus", "-b:a", "160k"])
-        else:
-            cmd.extend(["-an"])
+        cmd.extend(_build_audio_args(video_info, mp4_family=False))
 
         cmd.append(str(output_path))
         return cmd
 
 
+@lru_cache(maxsize=1)
+def _av1_software_encoder() -> str:
+    """Return the preferred software AV1 encoder, probing ffmpeg once per process."""
+    from .utils import check_encoder_available
+
+    for encoder in ("libsvtav1", "libaom-av1"):
+        if check_encoder_available(encoder):
+            return encoder
+    return "av1"
+
+
 @register_codec
 class AV1Handler(CodecHandler):
     """Handler for AV1 encoding."""
 
+    _COMPATIBLE_CODECS: frozenset[str] = frozenset({"av1"})
+
+    _CAPABILITIES = CodecCapabilities(
+        name="av1",
+        display_name="AV1",
+        container="mkv",
+        supports_quicksync_encode=True,
+        supports_quicksync_decode=True,
+        unity_compatible=False,
+    )
+
     @classmethod
     def capabilities(cls) -> CodecCapabilities:
-        return CodecCapabilities(
-            name="av1",
-            display_name="AV1",
-            container="mkv",
-            supports_quicksync_encode=True,
-            supports_quicksync_decode=True,
-            unity_compatible=False,
-        )
+        return cls._CAPABILITIES
 
     @classmethod
     def is_compatible(cls, video_info: VideoInfo) -> bool:
-        return video_info.codec_name.lower() == "av1"
+        return video_info.codec_name in cls._COMPATIBLE_CODECS
 
     @classmethod
     def build_encode_command(
@@ -536,20 +640,32 @@ class AV1Handler(CodecHandler):
         accel: type["HardwareAccelerator"] | None,
         hw_encode_enabled: bool = False,
         hw_decode_enabled: bool = False,
+        start_time: float | None = None,
+        duration: float | None = None,
     ) -> list[str]:
         av1_cfg = cfg.av1
-        cmd = ["ffmpeg", "-y", "-hide_banner"]
+        cmd = list(_FFMPEG_PREAMBLE)
 
         # Hardware decoder if available
         if hw_decode_enabled:
             if decoder := cls.get_hw_decoder(video_info, accel):
                 cmd.extend(["-c:v", decoder])
 
-        cmd.extend(["-i", str(input_path)])
+        cmd.extend(_input_args(input_path, start_time, duration))
 
         # Encoder selection
-        from .utils import check_encoder_available
-        if hw_encode_enabled and accel is not None:
+        if hw_encode_enabled and accel is not None and accel.capabilities().name == "nvenc":
+            # NVENC AV1 (-cq is limited to 0-51)
+            cmd.extend([
+                "-c:v", "av1_nvenc",
+                "-preset", "p4",
+                "-rc", "vbr",
+                "-cq", str(min(int(av1_cfg.crf), 51)),
+                "-b:v", "0",
+                "-pix_fmt", "yuv420p",
+            ])
+            cmd.extend(_nvenc_quality_args(cfg, accel, "av1_nvenc"))
+        elif hw_encode_enabled and accel is not None:
             # QSV AV1
             cmd.extend([
                 "-c:v", "av1_qsv",
@@ -557,7 +673,7 @@ class AV1Handler(CodecHandler):
                 "-global_quality", str(av1_cfg.crf),
                 "-pix_fmt", "nv12",
             ])
-        elif check_encoder_available("libsvtav1"):
+        elif (sw_encoder := _av1_software_encoder()) == "libsvtav1":
             # Software SVT-AV1
             cmd.extend([
                 "-c:v", "libsvtav1",
@@ -566,12 +682,14 @@ class AV1Handler(CodecHandler):
                 "-g", "240",
                 "-pix_fmt", "yuv420p10le",
             ])
-        elif check_encoder_available("libaom-av1"):
+        elif sw_encoder == "libaom-av1":
             # Software libaom-av1
             cmd.extend([
                 "-c:v", "libaom-av1",
                 "-crf", str(av1_cfg.crf),
                 "-cpu-used", str(av1_cfg.cpu_used),
+                "-row-mt", "1",
+                "-tiles", "2x2",
                 "-g", "240",
                 "-pix_fmt", "yuv420p10le",
             ])
@@ -579,40 +697,20 @@ class AV1Handler(CodecHandler):
             # Fallback to generic av1 encoder
             cmd.extend(["-c:v", "av1"])
 
-        cmd.extend(["-vsync", "cfr"])
+        cmd.extend(_VSYNC_CFR)
 
         # Optional caps
         if cfg.general.max_bitrate_kbps:
-            max_k = int(cfg.general.max_bitrate_kbps)
-            cmd.extend(["-maxrate", f"{max_k}k", "-bufsize", f"{max_k * 2}k"])
-
-        # Video filters
-        vf: list[str] = []
-        if cfg.general.max_resolution:
-            max_w, max_h = cfg.general.max_resolution
-            vf.append(f"scale='min(iw,{int(max_w)})':'min(ih,{int(max_h)})':force_original_aspect_ratio=decrease")
-        if cfg.general.max_fps:
-            vf.append(f"fps=fps={int(cfg.general.max_fps)}")
-        if vf:
-            cmd.extend(["-vf", ",".join(vf)])
+            cmd.extend(_bitrate_args(int(cfg.general.max_bitrate_kbps)))
+
+        cmd.extend(_video_filter_args(cfg, pad_to_resolution=False))
 
         # Audio handling - Opus for MKV/WebM, AAC for MP4
-        if video_info.has_audio:
-            if output_path.suffix.lower() in (".mp4", ".mov"):
-                if video_info.audio_codec in ("aac", "mp3", "alac"):
-                    cmd.extend(["-c:a", "copy"])
-                else:
-                    cmd.extend(["-c:a", "aac", "-b:a", "192k"])
-            else:
-                if video_info.audio_codec in ("opus", "vorbis"):
-                    cmd.extend(["-c:a", "copy"])
-                else:
-                    cmd.extend(["-c:a", "libopus", "-b:a", "160k"])
-        else:
-            cmd.extend(["-an"])
+        mp4_output = output_path.suffix.lower() in (".mp4", ".mov")
+        cmd.extend(_build_audio_args(video_info, mp4_family=mp4_output))
 
-        if output_path.suffix.lower() in (".mp4", ".mov"):
-            cmd.extend(["-movflags", "+faststart"])
+        if mp4_output:
+            cmd.extend(_FASTSTART_MOVFLAGS)
 
         cmd.append(str(output_path))
         return cmd
@@ -623,7 +721,7 @@ class AV1Handler(CodecHandler):
 # ============================================================
 
 
-@dataclass
+@dataclass(frozen=True)
 class AudioCodecCapabilities:
     """Describes an audio codec handler's capabilities."""
 
@@ -677,7 +775,7 @@ class AudioCodecHandler(ABC):
     def is_container_compatible(cls, path: Path) -> bool:
         """Return True if the file extension matches this codec's container."""
         ext = path.suffix.lower().lstrip(".")
-        return ext in set(cls.capabilities().container_extensions)
+        return ext in cls.capabilities().container_extensions
 
 
 # Global audio codec registry
@@ -711,9 +809,7 @@ def _audio_common_prefix(input_path: Path) -> list[str]:
     # `-map 0:a:0?` selects the first audio stream if present, and avoids a hard
     # error for containers without audio (ffmpeg will fail later on encoding).
     return [
-        "ffmpeg",
-        "-y",
-        "-hide_banner",
+        *_FFMPEG_PREAMBLE,
         "-i",
         str(input_path),
         "-map",
@@ -735,14 +831,16 @@ def _audio_force_extension(path: Path, extensions: Iterable[str]) -> None:
 class MP3AudioHandler(AudioCodecHandler):
     """Handler for MP3 (LAME) encoding."""
 
+    _CAPABILITIES = AudioCodecCapabilities(
+        name="mp3",
+        display_name="MP3 (LAME)",
+        container="mp3",
+        container_extensions=("mp3",),
+    )
+
     @classmethod
     def capabilities(cls) -> AudioCodecCapabilities:
-        return AudioCodecCapabilities(
-            name="mp3",
-            display_name="MP3 (LAME)",
-            container="mp3",
-            container_extensions=("mp3",),
-        )
+        return cls._CAPABILITIES
 
     @classmethod
     def validate_config(cls, cfg: "TranscoderConfig") -> None:
@@ -762,7 +860,7 @@ class MP3AudioHandler(AudioCodecHandler):
 
         cmd = _audio_common_prefix(input_path)
         if stream_copy:
-            cmd.extend(["-c:a", "copy"])
+            cmd.extend(_AUDIO_COPY)
         else:
             cmd.extend([
                 "-c:a",
@@ -778,14 +876,16 @@ class MP3AudioHandler(AudioCodecHandler):
 class VorbisAudioHandler(AudioCodecHandler):
     """Handler for Ogg Vorbis encoding."""
 
+    _CAPABILITIES = AudioCodecCapabilities(
+        name="vorbis",
+        display_name="Ogg Vorbis",
+        container="ogg",
+        container_extensions=("ogg",),
+    )
+
     @classmethod
     def capabilities(cls) -> AudioCodecCapabilities:
-        return AudioCodecCapabilities(
-            name="vorbis",
-            display_name="Ogg Vorbis",
-            container="ogg",
-            container_extensions=("ogg",),
-        )
+        return cls._CAPABILITIES
 
     @classmethod
     def validate_config(cls, cfg: "TranscoderConfig") -> None:
@@ -805,7 +905,7 @@ class VorbisAudioHandler(AudioCodecHandler):
 
         cmd = _audio_common_prefix(input_path)
         if stream_copy:
-            cmd.extend(["-c:a", "copy"])
+            cmd.extend(_AUDIO_COPY)
         else:
             cmd.extend([
                 "-c:a",
@@ -821,15 +921,17 @@ class VorbisAudioHandler(AudioCodecHandler):
 class AACAudioHandler(AudioCodecHandler):
     """Handler for AAC (native `aac`) encoding in an M4A container."""
 
+    _CAPABILITIES = AudioCodecCapabilities(
+        name="aac",
+        display_name="AAC (M4A)",
+        container="m4a",
+        # Accept mp4 as compatible container for AAC stream-copy operations.
+        container_extensions=("m4a", "mp4"),
+    )
+
     @classmethod
     def capabilities(cls) -> AudioCodecCapabilities:
-        return AudioCodecCapabilities(
-            name="aac",
-            display_name="AAC (M4A)",
-            container="m4a",
-            # Accept mp4 as compatible container for AAC stream-copy operations.
-            container_extensions=("m4a", "mp4"),
-        )
+        return cls._CAPABILITIES
 
     @classmethod
     def validate_config(cls, cfg: "TranscoderConfig") -> None:
@@ -849,7 +951,7 @@ class AACAudioHandler(AudioCodecHandler):
 
         cmd = _audio_common_prefix(input_path)
         if stream_copy:
-            cmd.extend(["-c:a", "copy"])
+            cmd.extend(_AUDIO_COPY)
         else:
             cmd.extend([
                 "-c:a",
@@ -860,7 +962,7 @@ class AACAudioHandler(AudioCodecHandler):
 
         # MP4-family containers: enable faststart.
         if output_path.suffix.lower() in (".m4a", ".mp4", ".mov"):
-            cmd.extend(["-movflags", "+faststart"])
+            cmd.extend(_FASTSTART_MOVFLAGS)
 
         cmd.append(str(output_path))
         return cmd
@@ -870,14 +972,16 @@ class AACAudioHandler(AudioCodecHandler):
 class OpusAudioHandler(AudioCodecHandler):
     """Handler for Opus (`libopus`) encoding in an Ogg Opus container."""
 
+    _CAPABILITIES = AudioCodecCapabilities(
+        name="opus",
+        display_name="Opus",
+        container="opus",
+        container_extensions=("opus",),
+    )
+
     @classmethod
     def capabilities(cls) -> AudioCodecCapabilities:
-        return AudioCodecCapabilities(
-            name="opus",
-            display_name="Opus",
-            container="opus",
-            container_extensions=("opus",),
-        )
+        return cls._CAPABILITIES
 
     @classmethod
     def validate_config(cls, cfg: "TranscoderConfig") -> None:
@@ -897,7 +1001,7 @@ class OpusAudioHandler(AudioCodecHandler):
 
         cmd = _audio_common_prefix(input_path)
         if stream_copy:
-            cmd.extend(["-c:a", "copy"])
+            cmd.extend(_AUDIO_COPY)
         else:
             cmd.extend([
                 "-c:a",
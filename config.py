@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import copy
 import json
 import logging
-from dataclasses import asdict, dataclass, field
+import os
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Literal, Optional
 
@@ -18,7 +20,7 @@ HEVCProfile = Literal["main", "main10"]
 AudioNormalizationMethod = Literal["loudnorm", "replaygain"]
 
 
-@dataclass
+@dataclass(slots=True)
 class H264Config:
     """Configuration for H.264 encoding."""
     profile: H264Profile = "high"
@@ -28,7 +30,7 @@ class H264Config:
     container: str = "mp4"
 
 
-@dataclass
+@dataclass(slots=True)
 class VP8Config:
     """Configuration for VP8 encoding."""
     crf: int = 10
@@ -36,7 +38,7 @@ class VP8Config:
     container: str = "webm"
 
 
-@dataclass
+@dataclass(slots=True)
 class HEVCConfig:
     """Configuration for HEVC encoding."""
     profile: HEVCProfile = "main"
@@ -46,7 +48,7 @@ class HEVCConfig:
     container: str = "mp4"
 
 
-@dataclass
+@dataclass(slots=True)
 class VP9Config:
     """Configuration for VP9 encoding."""
     crf: int = 20
@@ -55,7 +57,7 @@ class VP9Config:
     container: str = "webm"
 
 
-@dataclass
+@dataclass(slots=True)
 class AV1Config:
     """Configuration for AV1 encoding."""
     crf: int = 20
@@ -63,7 +65,15 @@ class AV1Config:
     container: str = "mkv"
 
 
-@dataclass
+@dataclass(slots=True)
+class NvencConfig:
+    """Configuration for NVIDIA NVENC hardware encoding."""
+    # Spatial/temporal AQ, lookahead and multipass. Only applied when the
+    # GPU/driver accepts them.
+    quality_flags: bool = True
+
+
+@dataclass(slots=True)
 class AudioConfig:
     """Configuration for standalone audio transcoding.
 
@@ -103,7 +113,7 @@ class AudioConfig:
     audio_normalization_method: AudioNormalizationMethod = "loudnorm"
 
 
-@dataclass
+@dataclass(slots=True)
 class GeneralConfig:
     """General transcoding settings."""
     hardware_encoding: bool = True
@@ -122,7 +132,7 @@ class GeneralConfig:
     force_transcode_video: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class UsdbIntegrationConfig:
     """Optional integration with USDB Syncer settings."""
 
@@ -130,7 +140,7 @@ class UsdbIntegrationConfig:
     use_usdb_fps: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscoderConfig:
     """Root configuration object."""
     # NOTE: This addon is still pre-release; keep the schema version stable.
@@ -143,11 +153,39 @@ class TranscoderConfig:
     hevc: HEVCConfig = field(default_factory=HEVCConfig)
     vp9: VP9Config = field(default_factory=VP9Config)
     av1: AV1Config = field(default_factory=AV1Config)
+    nvenc: NvencConfig = field(default_factory=NvencConfig)
     audio: AudioConfig = field(default_factory=AudioConfig)
     general: GeneralConfig = field(default_factory=GeneralConfig)
     usdb_integration: UsdbIntegrationConfig = field(default_factory=UsdbIntegrationConfig)
 
 
+# Nested section dataclasses of TranscoderConfig, keyed by their JSON key.
+_SECTIONS: dict[str, type] = {
+    "h264": H264Config,
+    "vp8": VP8Config,
+    "hevc": HEVCConfig,
+    "vp9": VP9Config,
+    "av1": AV1Config,
+    "nvenc": NvencConfig,
+    "audio": AudioConfig,
+    "general": GeneralConfig,
+    "usdb_integration": UsdbIntegrationConfig,
+}
+_SECTION_FIELD_NAMES: dict[type, tuple[str, ...]] = {
+    cls: tuple(f.name for f in fields(cls)) for cls in _SECTIONS.values()
+}
+_SECTION_FIELD_SETS: dict[type, frozenset[str]] = {
+    cls: frozenset(names) for cls, names in _SECTION_FIELD_NAMES.items()
+}
+_ROOT_VALUE_FIELDS: tuple[str, ...] = tuple(
+    f.name for f in fields(TranscoderConfig) if f.name not in _SECTIONS
+)
+
+
+# Last parsed config and the (mtime_ns, size) of the file it was read from
+_loaded_config: tuple[tuple[int, int], TranscoderConfig] | None = None
+
+
 def get_config_path() -> Path:
     """Return path to config file in USDB Syncer data directory."""
     from usdb_syncer.utils import AppPaths
@@ -155,7 +193,12 @@ def get_config_path() -> Path:
 
 
 def load_config() -> TranscoderConfig:
-    """Load configuration from JSON file, creating defaults if needed."""
+    """Load configuration from JSON file, creating defaults if needed.
+
+    The parsed config is reused while the file's mtime and size are unchanged;
+    every call still returns an independent object.
+    """
+    global _loaded_config
     config_path = get_config_path()
 
     if not config_path.exists():
@@ -165,20 +208,56 @@ def load_config() -> TranscoderConfig:
         return cfg
 
     try:
-        with config_path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-        return _parse_config(data)
+        st = config_path.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        if _loaded_config is not None and _loaded_config[0] == stamp:
+            # Callers (e.g. the settings dialog) mutate the result, so hand out a copy.
+            return copy.deepcopy(_loaded_config[1])
+
+        # json.loads decodes UTF-8 bytes itself, skipping the text I/O layer.
+        data = json.loads(config_path.read_bytes())
+        cfg = _parse_config(data)
+        _loaded_config = (stamp, copy.deepcopy(cfg))
+        return cfg
     except (json.JSONDecodeError, KeyError, TypeError) as e:
         _logger.warning(f"Config parse error, using defaults: {e}")
         return TranscoderConfig()
 
 
 def save_config(cfg: TranscoderConfig) -> None:
-    """Save configuration to JSON file."""
+    """Save configuration to JSON file.
+
+    Nothing is written if the file already has the same content. Otherwise the
+    file is replaced atomically, so an interrupted save never leaves a
+    truncated config behind.
+    """
+    global _loaded_config
     config_path = get_config_path()
+    payload = json.dumps(_config_to_dict(cfg), indent=2).encode("utf-8")
+    try:
+        if config_path.read_bytes() == payload:
+            return
+    except OSError:
+        pass
+
     config_path.parent.mkdir(parents=True, exist_ok=True)
-    with config_path.open("w", encoding="utf-8") as f:
-        json.dump(asdict(cfg), f, indent=2)
+    tmp_path = config_path.with_name(config_path.name + ".tmp")
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, config_path)
+    _loaded_config = None
+
+
+def _config_to_dict(cfg: TranscoderConfig) -> dict:
+    """Return the JSON-ready dict for cfg.
+
+    Equivalent to dataclasses.asdict for this fixed schema, but walks the
+    precomputed field names instead of recursively inspecting and deep-copying.
+    """
+    data = {name: getattr(cfg, name) for name in _ROOT_VALUE_FIELDS}
+    for key, cls in _SECTIONS.items():
+        section = getattr(cfg, key)
+        data[key] = {name: getattr(section, name) for name in _SECTION_FIELD_NAMES[cls]}
+    return data
 
 
 def _migrate_config(data: dict) -> dict:
@@ -225,20 +304,15 @@ def _parse_config(data: dict) -> TranscoderConfig:
     if "max_resolution" in general_data and general_data["max_resolution"]:
         general_data["max_resolution"] = tuple(general_data["max_resolution"])
 
-    # Filter out unknown fields for each dataclass to avoid TypeError
-    def get_clean_dict(cls, d):
-        return {k: v for k, v in d.items() if k in cls.__dataclass_fields__}
+    # Build each section from its known fields; unknown keys are ignored to avoid TypeError.
+    sections = {}
+    for key, cls in _SECTIONS.items():
+        known = _SECTION_FIELD_SETS[cls]
+        sections[key] = cls(**{k: v for k, v in data.get(key, {}).items() if k in known})
 
     return TranscoderConfig(
         version=data.get("version", 2),
         auto_transcode_enabled=data.get("auto_transcode_enabled", True),
         target_codec=data.get("target_codec", "h264"),
-        h264=H264Config(**get_clean_dict(H264Config, data.get("h264", {}))),
-        vp8=VP8Config(**get_clean_dict(VP8Config, data.get("vp8", {}))),
-        hevc=HEVCConfig(**get_clean_dict(HEVCConfig, data.get("hevc", {}))),
-        vp9=VP9Config(**get_clean_dict(VP9Config, data.get("vp9", {}))),
-        av1=AV1Config(**get_clean_dict(AV1Config, data.get("av1", {}))),
-        audio=AudioConfig(**get_clean_dict(AudioConfig, data.get("audio", {}))),
-        general=GeneralConfig(**get_clean_dict(GeneralConfig, general_data)),
-        usdb_integration=UsdbIntegrationConfig(**get_clean_dict(UsdbIntegrationConfig, data.get("usdb_integration", {}))),
+        **sections,
     )
@@ -1,14 +1,15 @@
-"""Hardware acceleration registry and QuickSync implementation."""
+"""Hardware acceleration registry and QuickSync/NVENC implementations."""
 
 from __future__ import annotations
 
 import subprocess
 import sys
+import tempfile
 from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
 from typing import TYPE_CHECKING, Dict, Type
 
-from usdb_syncer.utils import LinuxEnvCleaner
-
 if TYPE_CHECKING:
     from .video_analyzer import VideoInfo
 
@@ -49,6 +50,11 @@ class HardwareAccelerator:
         """Check if a specific encoder is available for this accelerator."""
         return cls.is_available()
 
+    @classmethod
+    def supports_encoder_options(cls, encoder: str, options: tuple[str, ...]) -> bool:
+        """Check if an encoder accepts the given extra options on this system."""
+        return cls.is_encoder_available(encoder)
+
     @classmethod
     def supports_platform(cls) -> bool:
         """Check if current platform is supported."""
@@ -56,14 +62,69 @@ class HardwareAccelerator:
         return sys.platform in caps.platforms
 
 
+def _run_probe(cmd: list[str], timeout: int) -> bool:
+    """Run an ffmpeg probe command and return whether it succeeded."""
+    # Imported on first probe rather than at addon import time.
+    from usdb_syncer.utils import LinuxEnvCleaner
+
+    try:
+        with LinuxEnvCleaner() as env:
+            result = subprocess.run(cmd, capture_output=True, timeout=timeout, env=env)
+        return result.returncode == 0
+    except Exception:
+        return False
+
+
+@lru_cache(maxsize=None)
+def _ffmpeg_codec_names(kind: str) -> frozenset[str] | None:
+    """Return the encoder or decoder names compiled into ffmpeg, or None if they can't be listed.
+
+    kind is "encoders" or "decoders".
+    """
+    from usdb_syncer.utils import LinuxEnvCleaner
+
+    cmd = ["ffmpeg", "-hide_banner", f"-{kind}"]
+    try:
+        with LinuxEnvCleaner() as env:
+            result = subprocess.run(
+                cmd, capture_output=True, text=True, encoding="utf-8", errors="replace", timeout=10, env=env
+            )
+    except Exception:
+        return None
+    if result.returncode != 0:
+        return None
+
+    # Lines after the "------" separator look like " V....D h264_qsv  description".
+    _, sep, listing = result.stdout.partition("------")
+    if not sep:
+        return None
+    return frozenset(parts[1] for line in listing.splitlines() if len(parts := line.split()) >= 2)
+
+
+def _encoder_compiled_in(encoder: str) -> bool:
+    """Return False only if ffmpeg's encoder list is known and lacks encoder.
+
+    Used to skip test encodes for encoders the ffmpeg build does not contain;
+    being listed does not mean the hardware/driver is present.
+    """
+    encoders = _ffmpeg_codec_names("encoders")
+    return encoders is None or encoder in encoders
+
+
 # Global registry
 HWACCEL_REGISTRY: Dict[str, Type[HardwareAccelerator]] = {}
 
+# Accelerator preference, best first
+_PRIORITY_ORDER = ("quicksync", "nvenc", "amf", "videotoolbox", "vaapi")
+
 
 def register_hwaccel(accel: Type[HardwareAccelerator]) -> Type[HardwareAccelerator]:
     """Decorator to register a hardware accelerator."""
     caps = accel.capabilities()
     HWACCEL_REGISTRY[caps.name] = accel
+    # Selection results depend on the registry contents.
+    _platform_accelerators.cache_clear()
+    get_best_accelerator.cache_clear()
     return accel
 
 
@@ -76,51 +137,67 @@ def detect_available_accelerators() -> list[HWAccelCapabilities]:
     return available
 
 
+@lru_cache(maxsize=1)
+def _platform_accelerators() -> tuple[Type[HardwareAccelerator], ...]:
+    """Return registered accelerators supported on this platform, in priority order."""
+    return tuple(
+        accel
+        for name in _PRIORITY_ORDER
+        if (accel := HWACCEL_REGISTRY.get(name)) is not None and accel.supports_platform()
+    )
+
+
+@lru_cache(maxsize=None)
 def get_best_accelerator(codec: str) -> Type[HardwareAccelerator] | None:
     """Get the best available accelerator for a codec.
 
     Priority order: QuickSync > NVENC > AMF > VideoToolbox > VAAPI > None
+
+    The result is cached per codec; the underlying availability probes are
+    cached for the process lifetime as well.
     """
-    priority = ["quicksync", "nvenc", "amf", "videotoolbox", "vaapi"]
-
-    for name in priority:
-        if accel := HWACCEL_REGISTRY.get(name):
-            if accel.supports_platform():
-                caps = accel.capabilities()
-                encoder = getattr(caps, f"{codec}_encoder", None)
-                if not encoder:
-                    continue
-
-                # Check if the accelerator is available AND supports this specific encoder
-                if hasattr(accel, "is_encoder_available"):
-                    if accel.is_encoder_available(encoder):
-                        return accel
-                elif accel.is_available():
-                    # Fallback for accelerators that don't implement granular checks
-                    return accel
+    for accel in _platform_accelerators():
+        caps = accel.capabilities()
+        encoder = getattr(caps, f"{codec}_encoder", None)
+        if not encoder:
+            continue
+
+        # Check if the accelerator is available AND supports this specific encoder
+        if accel.is_encoder_available(encoder):
+            return accel
     return None
 
 
 def get_best_decoder_accelerator(video_info: VideoInfo) -> Type[HardwareAccelerator] | None:
     """Get the best available accelerator that supports decoding the input video."""
-    priority = ["quicksync", "nvenc", "amf", "videotoolbox", "vaapi"]
-
-    for name in priority:
-        if accel := HWACCEL_REGISTRY.get(name):
-            if accel.supports_platform() and accel.is_available():
-                if accel.get_decoder(video_info):
-                    return accel
+    for accel in _platform_accelerators():
+        if accel.is_available() and accel.get_decoder(video_info):
+            return accel
     return None
 
 
 # Cache availability check
 _qsv_available: bool | None = None
+# Cache of encoder -> opened successfully (per process)
+_qsv_encoder_cache: dict[str, bool] = {}
 
 
 @register_hwaccel
 class QuickSyncAccelerator(HardwareAccelerator):
     """Intel QuickSync Video hardware acceleration."""
 
+    # Input codec -> hardware decoder
+    _DECODERS: dict[str, str] = {
+        "h264": "h264_qsv",
+        "hevc": "hevc_qsv",
+        "h265": "hevc_qsv",
+        "vp9": "vp9_qsv",
+        "av1": "av1_qsv",
+        "mpeg2video": "mpeg2_qsv",
+        "vc1": "vc1_qsv",
+        "mjpeg": "mjpeg_qsv",
+    }
+
     @classmethod
     def capabilities(cls) -> HWAccelCapabilities:
         return HWAccelCapabilities(
@@ -147,18 +224,19 @@ class QuickSyncAccelerator(HardwareAccelerator):
             "-c:v", "h264_qsv",
             "-f", "null", "-"
         ]
-        try:
-            with LinuxEnvCleaner() as env:
-                result = subprocess.run(cmd, capture_output=True, timeout=10, env=env)
-            _qsv_available = result.returncode == 0
-        except Exception:
-            _qsv_available = False
+        _qsv_available = _run_probe(cmd, timeout=10)
 
         return _qsv_available
 
     @classmethod
     def is_encoder_available(cls, encoder: str) -> bool:
         """Test if a specific QSV encoder is available."""
+        if (available := _qsv_encoder_cache.get(encoder)) is not None:
+            return available
+        if not _encoder_compiled_in(encoder):
+            _qsv_encoder_cache[encoder] = False
+            return False
+
         # We use a small nullsrc test to see if the encoder can actually be opened.
         cmd = [
             "ffmpeg", "-hide_banner",
@@ -168,23 +246,152 @@ class QuickSyncAccelerator(HardwareAccelerator):
         if encoder in ("h264_qsv", "hevc_qsv", "vp9_qsv", "av1_qsv"):
             cmd.extend(["-global_quality", "20"])
         cmd.extend(["-frames:v", "1", "-f", "null", "-"])
-        try:
-            with LinuxEnvCleaner() as env:
-                result = subprocess.run(cmd, capture_output=True, timeout=5, env=env)
-            return result.returncode == 0
-        except Exception:
+        available = _run_probe(cmd, timeout=5)
+        _qsv_encoder_cache[encoder] = available
+        return available
+
+    @classmethod
+    def get_decoder(cls, video_info: VideoInfo) -> str | None:
+        return cls._DECODERS.get(video_info.codec_name)
+
+
+# Cache availability check
+_nvenc_available: bool | None = None
+# Cache of encoder -> opened successfully (per process)
+_nvenc_encoder_cache: dict[str, bool] = {}
+# Cache of (encoder, options) -> accepted by this GPU/driver
+_nvenc_option_support: dict[tuple[str, tuple[str, ...]], bool] = {}
+# Cache of CUVID decoder -> decoded a test clip (per process)
+_cuvid_decoder_cache: dict[str, bool] = {}
+
+# CUVID decoder -> encoders able to produce its test clip, in preference order
+_CUVID_TEST_ENCODERS: dict[str, tuple[str, ...]] = {
+    "h264_cuvid": ("libx264", "h264_nvenc"),
+    "hevc_cuvid": ("libx265", "hevc_nvenc"),
+    "vp8_cuvid": ("libvpx",),
+    "vp9_cuvid": ("libvpx-vp9",),
+    "av1_cuvid": ("libsvtav1", "libaom-av1", "av1_nvenc"),
+    "mpeg2_cuvid": ("mpeg2video",),
+}
+
+
+def _cuvid_decoder_available(decoder: str) -> bool:
+    """Test (once per process) whether a CUVID decoder can decode on this GPU/driver.
+
+    NVDEC codec support varies by GPU generation (e.g. AV1 needs Ampere), so a
+    one-frame clip is encoded in software and decoded with the CUVID decoder.
+    """
+    if (available := _cuvid_decoder_cache.get(decoder)) is not None:
+        return available
+
+    decoders = _ffmpeg_codec_names("decoders")
+    encoders = _ffmpeg_codec_names("encoders") or frozenset()
+    test_encoder = next((e for e in _CUVID_TEST_ENCODERS.get(decoder, ()) if e in encoders), None)
+    if decoders is None or decoder not in decoders or test_encoder is None:
+        _cuvid_decoder_cache[decoder] = False
+        return False
+
+    with tempfile.TemporaryDirectory(prefix="transcoder_cuvid_") as tmp:
+        clip = str(Path(tmp) / "probe.mkv")
+        encode_cmd = [
+            "ffmpeg", "-hide_banner",
+            "-f", "lavfi", "-i", "testsrc=s=256x256:d=1",
+            "-c:v", test_encoder, "-pix_fmt", "yuv420p",
+            "-frames:v", "1", "-y", clip
+        ]
+        decode_cmd = ["ffmpeg", "-hide_banner", "-c:v", decoder, "-i", clip, "-f", "null", "-"]
+        available = _run_probe(encode_cmd, timeout=10) and _run_probe(decode_cmd, timeout=5)
+
+    _cuvid_decoder_cache[decoder] = available
+    return available
+
+
+@register_hwaccel
+class NvencAccelerator(HardwareAccelerator):
+    """NVIDIA NVENC (encode) / NVDEC via CUVID (decode) hardware acceleration."""
+
+    # Input codec -> hardware decoder
+    _DECODERS: dict[str, str] = {
+        "h264": "h264_cuvid",
+        "hevc": "hevc_cuvid",
+        "h265": "hevc_cuvid",
+        "vp8": "vp8_cuvid",
+        "vp9": "vp9_cuvid",
+        "av1": "av1_cuvid",
+        "mpeg2video": "mpeg2_cuvid",
+    }
+
+    @classmethod
+    def capabilities(cls) -> HWAccelCapabilities:
+        return HWAccelCapabilities(
+            name="nvenc",
+            display_name="NVIDIA NVENC",
+            platforms=("win32", "linux"),
+            h264_encoder="h264_nvenc",
+            hevc_encoder="hevc_nvenc",
+            vp8_encoder=None,
+            vp9_encoder=None,                  # NVENC has no VP9 encoder
+            av1_encoder="av1_nvenc",           # Ada Lovelace (RTX 40) and newer
+        )
+
+    @classmethod
+    def is_available(cls) -> bool:
+        global _nvenc_available
+        if _nvenc_available is not None:
+            return _nvenc_available
+
+        # Test h264_nvenc encoder (NVENC rejects very small frames, so use 256x256)
+        cmd = [
+            "ffmpeg", "-hide_banner",
+            "-f", "lavfi", "-i", "nullsrc=s=256x256:d=0.1",
+            "-c:v", "h264_nvenc",
+            "-f", "null", "-"
+        ]
+        _nvenc_available = _run_probe(cmd, timeout=10)
+
+        return _nvenc_available
+
+    @classmethod
+    def is_encoder_available(cls, encoder: str) -> bool:
+        """Test if a specific NVENC encoder is available."""
+        if (available := _nvenc_encoder_cache.get(encoder)) is not None:
+            return available
+        if not _encoder_compiled_in(encoder):
+            _nvenc_encoder_cache[encoder] = False
             return False
 
+        # Not every NVENC generation supports every codec (e.g. av1_nvenc), so open the encoder.
+        cmd = [
+            "ffmpeg", "-hide_banner",
+            "-f", "lavfi", "-i", "nullsrc=s=256x256:d=1",
+            "-c:v", encoder,
+            "-frames:v", "1", "-f", "null", "-"
+        ]
+        available = _run_probe(cmd, timeout=5)
+        _nvenc_encoder_cache[encoder] = available
+        return available
+
+    @classmethod
+    def supports_encoder_options(cls, encoder: str, options: tuple[str, ...]) -> bool:
+        """Test (once per process) whether the encoder accepts the options on this GPU/driver."""
+        key = (encoder, options)
+        if (supported := _nvenc_option_support.get(key)) is not None:
+            return supported
+
+        cmd = [
+            "ffmpeg", "-hide_banner",
+            "-f", "lavfi", "-i", "nullsrc=s=256x256:d=1",
+            "-c:v", encoder, *options,
+            "-frames:v", "1", "-f", "null", "-"
+        ]
+        supported = _run_probe(cmd, timeout=5)
+
+        _nvenc_option_support[key] = supported
+        return supported
+
     @classmethod
     def get_decoder(cls, video_info: VideoInfo) -> str | None:
-        codec_map = {
-            "h264": "h264_qsv",
-            "hevc": "hevc_qsv",
-            "h265": "hevc_qsv",
-            "vp9": "vp9_qsv",
-            "av1": "av1_qsv",
-            "mpeg2video": "mpeg2_qsv",
-            "vc1": "vc1_qsv",
-            "mjpeg": "mjpeg_qsv",
-        }
-        return codec_map.get(video_info.codec_name.lower())
+        decoder = cls._DECODERS.get(video_info.codec_name)
+        if decoder and cls.is_available() and _cuvid_decoder_available(decoder):
+            return decoder
+        return None
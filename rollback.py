@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import shutil
 import time
 from dataclasses import dataclass
@@ -54,6 +55,18 @@ class RollbackEntry:
         )
 
 
+def _restore_file(backup_path: Path, target_path: Path) -> None:
+    """Move a rollback backup into place, copying only across filesystems.
+
+    The rollback directory is deleted afterwards, so the backup can be moved
+    instead of copied whenever a rename is possible.
+    """
+    try:
+        os.replace(backup_path, target_path)
+    except OSError:
+        shutil.copy2(str(backup_path), str(target_path))
+
+
 class RollbackManager:
     """Manages rollback operations for batch transcoding."""
 
@@ -66,6 +79,7 @@ class RollbackManager:
         self.entries: list[RollbackEntry] = []
         self._manifest_path: Optional[Path] = None
         self._rollback_dir: Optional[Path] = None
+        self._sync_meta_by_id: Optional[dict[SongId, SyncMeta]] = None
 
     def enable_rollback(self) -> Path:
         """Enable rollback and create temp directory.
@@ -80,7 +94,7 @@ class RollbackManager:
         self._rollback_dir = Path(tempfile.gettempdir()) / "usdb_syncer_transcoder" / f"rollback_{timestamp}"
         self._rollback_dir.mkdir(parents=True, exist_ok=True)
         
-        self._manifest_path = self._rollback_dir / f"rollback_manifest_{timestamp}.json"
+        self._manifest_path = self._rollback_dir / f"rollback_manifest_{timestamp}.jsonl"
         _logger.info(f"Rollback enabled. Directory: {self._rollback_dir}")
         
         return self._rollback_dir
@@ -130,7 +144,7 @@ class RollbackManager:
             user_backup_existed=user_backup_existed
         )
         self.entries.append(entry)
-        self._save_manifest()
+        self._append_manifest_entry(entry)
 
     # Backward-compatible wrapper for older callers.
     def record_video_transcode(
@@ -160,6 +174,9 @@ class RollbackManager:
         failed = 0
         successful_ids = []
 
+        # Scan the song folder once for the whole rollback instead of per entry.
+        self._sync_meta_by_id = self._index_sync_metas()
+
         # Rollback in reverse order
         for entry in reversed(self.entries):
             try:
@@ -175,8 +192,8 @@ class RollbackManager:
                 if entry.original_path.exists():
                     entry.original_path.unlink()
                 
-                # Copy rollback backup back to original location
-                shutil.copy2(str(entry.rollback_backup_path), str(entry.original_path))
+                # Move rollback backup back to original location
+                _restore_file(entry.rollback_backup_path, entry.original_path)
                 
                 # 2. Delete new output if different from original location
                 if entry.new_output_path.exists() and entry.new_output_path != entry.original_path:
@@ -191,6 +208,7 @@ class RollbackManager:
                 _logger.error(f"Rollback failed for {entry.song_id}: {e}")
                 failed += 1
 
+        self._sync_meta_by_id = None
         self._cleanup_rollback_directory()
         return success, failed, successful_ids
 
@@ -208,19 +226,22 @@ class RollbackManager:
             except Exception as e:
                 _logger.warning(f"Failed to delete rollback directory {self._rollback_dir}: {e}")
 
-    def _save_manifest(self) -> None:
-        """Persist manifest to disk."""
+    def _append_manifest_entry(self, entry: RollbackEntry) -> None:
+        """Append one entry to the on-disk manifest.
+
+        The manifest is JSON Lines: a header object followed by one entry per
+        line, so recording a transcode never rewrites earlier entries.
+        """
         if not self._manifest_path:
             return
 
         try:
-            data = {
-                "version": 2,
-                "created_at": time.time(),
-                "entries": [e.to_dict() for e in self.entries]
-            }
-            with self._manifest_path.open("w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            with self._manifest_path.open("a", encoding="utf-8") as f:
+                if f.tell() == 0:
+                    f.write(json.dumps({"version": 3, "created_at": time.time()}) + "\n")
+                f.write(json.dumps(entry.to_dict()) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
         except Exception as e:
             _logger.error(f"Failed to save rollback manifest: {e}")
 
@@ -232,7 +253,7 @@ class RollbackManager:
             return
 
         if entry.media_type == "audio":
-            if getattr(sync_meta, "audio", None) and sync_meta.audio and sync_meta.audio.file:
+            if sync_meta.audio and sync_meta.audio.file:
                 sync_meta.audio.file = ResourceFile.new(entry.original_path, sync_meta.audio.file.resource)
                 sync_meta.synchronize_to_file()
                 sync_meta.upsert()
@@ -248,8 +269,19 @@ class RollbackManager:
 
     def _get_sync_meta(self, song_id: SongId) -> Optional[SyncMeta]:
         """Get SyncMeta for song ID."""
+        if self._sync_meta_by_id is not None:
+            return self._sync_meta_by_id.get(song_id)
         from usdb_syncer import settings
         for meta in SyncMeta.get_in_folder(settings.get_song_dir()):
             if meta.song_id == song_id:
                 return meta
         return None
+
+    @staticmethod
+    def _index_sync_metas() -> dict[SongId, SyncMeta]:
+        """Map song IDs to SyncMetas in the song folder (first match wins)."""
+        from usdb_syncer import settings
+        metas: dict[SongId, SyncMeta] = {}
+        for meta in SyncMeta.get_in_folder(settings.get_song_dir()):
+            metas.setdefault(meta.song_id, meta)
+        return metas
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import logging
+import os
 import shutil
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from PySide6 import QtCore
@@ -38,6 +40,20 @@ class RollbackBackupWorker(QtCore.QThread):
         """Request abort of the backup operation."""
         self._abort_requested = True
 
+    @staticmethod
+    def _try_link(source: Path, target: Path) -> bool:
+        """Hard-link target to source; return False if that isn't possible (e.g. other drive).
+
+        A link is a valid snapshot because the transcoder never rewrites an
+        original in place: it moves or unlinks it and renames the new output
+        into position.
+        """
+        try:
+            os.link(source, target)
+        except OSError:
+            return False
+        return True
+
     def run(self) -> None:
         """Execute background backup creation."""
         total = len(self.candidates)
@@ -61,9 +77,15 @@ class RollbackBackupWorker(QtCore.QThread):
             try:
                 # Ensure parent directory exists (RollbackManager should handle this, but being safe)
                 rollback_backup_path.parent.mkdir(parents=True, exist_ok=True)
-                
+
+                if self._try_link(candidate.video_path, rollback_backup_path):
+                    # Count the linked file so the dialog's file and byte totals stay accurate
+                    bytes_copied_total += rollback_backup_path.stat().st_size
+                    self.progress.emit(i, total, filename, bytes_copied_total)
+                    _logger.debug(f"Hard-linked rollback backup: {rollback_backup_path}")
+                    continue
+
                 # Perform the copy in chunks to allow for responsive abort
-                source_size = candidate.video_path.stat().st_size
                 with open(candidate.video_path, "rb") as fsrc:
                     with open(rollback_backup_path, "wb") as fdst:
                         chunk_size = 1024 * 1024  # 1MB chunks
@@ -86,7 +108,7 @@ class RollbackBackupWorker(QtCore.QThread):
 
                 # Update total bytes copied
                 # We'll use bytes for precision and format in the dialog
-                bytes_copied_total += candidate.video_path.stat().st_size
+                bytes_copied_total += bytes_copied_file
                 
                 _logger.debug(f"Created rollback backup: {rollback_backup_path}")
             except Exception as e:
@@ -82,6 +82,7 @@ class TranscoderSettingsDialog(QDialog):
             "Use hardware-accelerated video encoding when available.<br/>"
             "Automatically detects and uses best method for your system:<br/>"
             "• Intel QuickSync (Intel CPUs 6th gen+)<br/>"
+            "• NVIDIA NVENC (GeForce GTX 600+; AV1 requires RTX 40 series)<br/>"
             "<br/>"
             "<b>Impact:</b> 3-5x faster encoding on supported hardware<br/>"
             "<b>Recommended:</b> Enable if you have compatible hardware"
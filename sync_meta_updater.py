@@ -162,7 +162,7 @@ def update_sync_meta_audio(
 
     # Preserve original resource ID
     original_resource_id = ""
-    if getattr(sync_meta, "audio", None) and sync_meta.audio.file:
+    if sync_meta.audio and sync_meta.audio.file:
         original_resource_id = sync_meta.audio.file.resource
         slog.debug(f"Preserving original audio resource ID: {original_resource_id[:50]}...")
 
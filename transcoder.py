@@ -424,6 +424,23 @@ def process_video(
         success, aborted = _execute_ffmpeg(
             cmd, cfg.general.timeout_seconds, slog, song.song_id, video_info.duration_seconds, video_info.frame_rate, progress_callback
         )
+        if not success and not aborted and hw_decode_enabled:
+            # A hardware decoder can still reject a particular stream (profile, size, driver).
+            slog.warning("Transcode with hardware decoding failed; retrying with software decoding")
+            _safe_unlink(temp_output_path)
+            cmd = handler.build_encode_command(
+                video_path,
+                temp_output_path,
+                video_info,
+                cfg,
+                accel,
+                hw_encode_enabled=hw_encode_enabled,
+                hw_decode_enabled=False,
+            )
+            slog.debug(f"FFMPEG command: {' '.join(cmd)}")
+            success, aborted = _execute_ffmpeg(
+                cmd, cfg.general.timeout_seconds, slog, song.song_id, video_info.duration_seconds, video_info.frame_rate, progress_callback
+            )
     except Exception as e:
         # Cleanup partial output
         _safe_unlink(temp_output_path)
@@ -54,35 +54,47 @@ def check_encoder_available(encoder: str) -> bool:
         return False
 
 
+# ffprobe arguments for the analyzers' fast first pass: read at most 32 KiB
+# (instead of ~5 MB) while detecting stream parameters.
+FAST_PROBE_ARGS = ("-probesize", "32k")
+
+
+# Standalone audio containers recognised by the addon (lowercase, with leading dot).
+_AUDIO_EXTENSIONS = frozenset({
+    ".mp3",
+    ".m4a",
+    ".aac",
+    ".ogg",
+    ".opus",
+    ".wav",
+    ".flac",
+    ".alac",
+})
+
+# Video containers recognised by the addon (lowercase, with leading dot).
+_VIDEO_EXTENSIONS = frozenset({
+    ".mp4",
+    ".mov",
+    ".mkv",
+    ".webm",
+    ".avi",
+    ".wmv",
+    ".m4v",
+})
+
+
 def is_audio_file(path: str | Path) -> bool:
     """Return True if the file extension looks like a standalone audio format."""
 
     p = path if isinstance(path, Path) else Path(path)
-    return p.suffix.lower() in (
-        ".mp3",
-        ".m4a",
-        ".aac",
-        ".ogg",
-        ".opus",
-        ".wav",
-        ".flac",
-        ".alac",
-    )
+    return p.suffix.lower() in _AUDIO_EXTENSIONS
 
 
 def is_video_file(path: str | Path) -> bool:
     """Return True if the file extension looks like a video container."""
 
     p = path if isinstance(path, Path) else Path(path)
-    return p.suffix.lower() in (
-        ".mp4",
-        ".mov",
-        ".mkv",
-        ".webm",
-        ".avi",
-        ".wmv",
-        ".m4v",
-    )
+    return p.suffix.lower() in _VIDEO_EXTENSIONS
 
 
 def time_to_seconds(time_str: str) -> float:
@@ -11,7 +11,7 @@ from typing import TYPE_CHECKING, Optional
 
 from usdb_syncer.utils import LinuxEnvCleaner
 
-from .utils import format_seconds
+from .utils import FAST_PROBE_ARGS, format_seconds
 
 if TYPE_CHECKING:
     from .config import TranscoderConfig
@@ -19,7 +19,7 @@ if TYPE_CHECKING:
 _logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoInfo:
     """Information about a video file."""
     codec_name: str                    # e.g., "h264", "vp9", "hevc"
@@ -36,40 +36,103 @@ class VideoInfo:
     profile: Optional[str]             # e.g., "Main", "Baseline"
     level: Optional[str]               # e.g., "3.1"
 
+    def __post_init__(self) -> None:
+        # Normalize once so codec checks can compare directly.
+        self.codec_name = self.codec_name.lower()
+        if self.audio_codec:
+            self.audio_codec = self.audio_codec.lower()
+
     @property
     def is_h264(self) -> bool:
-        return self.codec_name.lower() in ("h264", "avc")
+        return self.codec_name in ("h264", "avc")
 
     @property
     def is_vp8(self) -> bool:
-        return self.codec_name.lower() == "vp8"
+        return self.codec_name == "vp8"
 
     @property
     def is_vp9(self) -> bool:
-        return self.codec_name.lower() == "vp9"
+        return self.codec_name == "vp9"
 
     @property
     def is_hevc(self) -> bool:
-        return self.codec_name.lower() in ("hevc", "h265")
+        return self.codec_name in ("hevc", "h265")
 
     @property
     def is_av1(self) -> bool:
-        return self.codec_name.lower() == "av1"
+        return self.codec_name == "av1"
+
+
+# Formats without stream headers; a small probe may miss streams or parameters.
+_HEADERLESS_FORMATS = frozenset({"mpegts", "mpeg", "h264", "hevc", "m4v", "rawvideo"})
 
 
 def analyze_video(path: Path) -> Optional[VideoInfo]:
     """Analyze video file with ffprobe.
 
+    A probe limited to the first 32 KiB is tried first; if it does not yield
+    every stream parameter VideoInfo needs, or its frame rate is only a guess,
+    the file is probed again with ffprobe's default limits.
+
     Returns None if analysis fails or file is not a valid video.
     """
+    data = _run_ffprobe(path, fast=True)
+    if data is None or not _is_fast_probe_complete(data):
+        _logger.debug(f"Fast probe incomplete for {path.name}; running full probe")
+        data = _run_ffprobe(path, fast=False)
+        if data is None:
+            return None
+    return _parse_ffprobe_output(data, path)
+
+
+def _is_fast_probe_complete(data: dict) -> bool:
+    """Return True if a fast probe can be trusted for every field VideoInfo relies on.
+
+    A frame rate that disagrees with the average rate is treated as a guess
+    from the few frames read, as is a missing bitrate.
+    """
+    format_info = data.get("format", {})
+    if any(name in _HEADERLESS_FORMATS for name in format_info.get("format_name", "").split(",")):
+        return False
+    streams = data.get("streams", [])
+    # Streams seen without codec parameters mean the probe stopped too early.
+    if any(not s.get("codec_name") for s in streams if s.get("codec_type") in ("video", "audio")):
+        return False
+    video_stream = next((s for s in streams if s.get("codec_type") == "video"), None)
+    if not video_stream:
+        return False
+    frame_rate = video_stream.get("r_frame_rate", "0/0")
+    try:
+        return (
+            int(video_stream.get("width", 0)) > 0
+            and int(video_stream.get("height", 0)) > 0
+            and bool(video_stream.get("pix_fmt"))
+            and frame_rate not in ("0/0", "0/1")
+            and frame_rate == video_stream.get("avg_frame_rate")
+            and ("bit_rate" in video_stream or "bit_rate" in format_info)
+            and float(format_info.get("duration", 0)) > 0
+        )
+    except (ValueError, TypeError):
+        return False
+
+
+def _run_ffprobe(path: Path, fast: bool) -> Optional[dict]:
+    """Run ffprobe on path and return its decoded JSON output, or None on failure.
+
+    Failures of the fast pass are logged at debug level only,
+    since the caller falls back to a full probe.
+    """
     cmd = [
         "ffprobe",
         "-v", "quiet",
         "-print_format", "json",
         "-show_format",
         "-show_streams",
-        str(path)
     ]
+    if fast:
+        cmd.extend(FAST_PROBE_ARGS)
+    cmd.append(str(path))
+    log_failure = _logger.debug if fast else _logger.warning
 
     try:
         _logger.debug(f"Running ffprobe: {' '.join(cmd)}")
@@ -85,17 +148,16 @@ def analyze_video(path: Path) -> Optional[VideoInfo]:
             )
 
         if result.returncode != 0:
-            _logger.warning(f"ffprobe failed for {path}: {result.stderr}")
+            log_failure(f"ffprobe failed for {path}: {result.stderr}")
             return None
 
-        data = json.loads(result.stdout)
-        return _parse_ffprobe_output(data, path)
+        return json.loads(result.stdout)
 
     except subprocess.TimeoutExpired:
         _logger.error(f"ffprobe timeout for {path}")
         return None
     except json.JSONDecodeError as e:
-        _logger.error(f"ffprobe output parse error: {e}")
+        log_failure(f"ffprobe output parse error: {e}")
         return None
     except Exception as e:
         _logger.error(f"ffprobe error for {path}: {type(e).__name__}: {e}")
@@ -182,7 +244,7 @@ def format_video_info(info: VideoInfo, minimal: bool = False, reasons: list[str]
         ]
 
         # Only show profile for codecs that use it meaningfully
-        if info.codec_name.lower() in ("h264", "avc", "hevc", "h265") and info.profile:
+        if info.codec_name in ("h264", "avc", "hevc", "h265") and info.profile:
             log_parts.append(f"profile={info.profile}")
 
         log_parts.extend(